@@ -1,12 +1,58 @@
 import os
 import re
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Every generated replacement carries this marker so a second run can tell the fix is already in
+FIX_MARKER = "MYFORGE_FIX_V1"
+
+# Patterns are compiled once at import and reused by every fix_* run. The fixes
+# for each file are joined into one alternation so its source is scanned in a
+# single pass; the named group that matched selects the replacement.
+_SFTP_FIXES_RE = re.compile(
+    r'(?P<connect>sftp = self\.ssh_client\.get_sftp_client\(\)\s+if not sftp:.*?return)'
+    r'|(?P<download_loop>for i, file_info in enumerate\(files_to_download\):.*?self\.logger\.debug\(f"SFTP: Downloaded \{remote_path\}"\)\s+except Exception as e:.*?self\.logger\.log\(f"SFTP: Exception re-establishing SFTP: \{recon_e\}", level=\'error\'\))'
+    r'|(?P<download_progress>def _download_progress\(self, transferred, total, filename, remote_path, local_path, callback=None\):.*?if callback:.*?callback\(filename, transferred, total, percent\))',
+    re.DOTALL
+)
+_TAB_FIXES_RE = re.compile(
+    r'(?P<on_progress>def on_progress\(filename, transferred, total, percent\):.*?progress_dialog\.update_progress\()'
+    r'|(?P<start_download># Start download.*?self\.sftp_ops\.download_files\()',
+    re.DOTALL
+)
+_GET_SFTP_CLIENT_RE = re.compile(
+    r'def get_sftp_client\(self\):.*?return None',
+    re.DOTALL
+)
+
+def _sub_fixes(pattern, replacements, content):
+    """Apply all of a file's fixes in one pass over its source"""
+    return pattern.sub(lambda match: replacements[match.lastgroup], content)
+
+def _read_source(path):
+    """Read a source file in a single buffered read"""
+    with open(path, 'r', buffering=1 << 20) as f:
+        return f.read()
+
+def _write_if_changed(path, original, content):
+    """Write patched content back only if it differs from what was read, returns True if written"""
+    if hashlib.blake2b(content.encode()).digest() == hashlib.blake2b(original.encode()).digest():
+        print(f"{path} unchanged, skipping write")
+        return False
+    
+    with open(path, 'w', buffering=1 << 20) as f:
+        f.write(content)
+    return True
 
 def fix_sftp_py():
     """Fix issues in sftp.py"""
     sftp_path = os.path.join("ssh", "sftp.py")
     
-    with open(sftp_path, 'r') as f:
-        content = f.read()
+    content = _read_source(sftp_path)
+    if FIX_MARKER in content:
+        print(f"{sftp_path} already fixed")
+        return
+    original = content
     
     # Fix syntax error on line 262
     content = content.replace(
@@ -22,6 +68,7 @@ def fix_sftp_py():
     
     # Add retry logic for SFTP connection
     connection_logic = '''
+        # MYFORGE_FIX_V1
         sftp = None
         retry_count = 0
         max_retries = 3
@@ -45,67 +92,144 @@ def fix_sftp_py():
                 on_complete(False, 0, 0, "Could not establish SFTP connection after multiple attempts")
             return'''
     
-    # Replace simple sftp connection check with retry logic
-    content = re.sub(
-        r'sftp = self\.ssh_client\.get_sftp_client\(\)\s+if not sftp:.*?return',
-        connection_logic,
-        content,
-        flags=re.DOTALL
-    )
+    # Download files in parallel, one pooled SFTP channel per worker
+    file_retry_logic = '''# MYFORGE_FIX_V1
+                with ThreadPoolExecutor(max_workers=self.ssh_client.sftp_pool_size) as executor:
+                    futures = [
+                        executor.submit(self._download_one, file_info['remote_path'],
+                                        file_info['local_path'], file_info['name'], on_progress)
+                        for file_info in files_to_download
+                    ]
+                    
+                    # Results are aggregated on this thread only, so the counters need no lock
+                    for future in as_completed(futures):
+                        if future.result():
+                            downloaded_files += 1
+                        else:
+                            failed_files += 1'''
     
-    # Add file download retry logic
-    file_retry_logic = '''
+    # Per-file download body, run on the executor workers
+    download_one = '''
+    # MYFORGE_FIX_V1
+    def _download_one(self, remote_path, local_path, file_name, on_progress):
+        """Download a single file with retry on a pooled SFTP channel, returns True on success"""
+        local_path = os.path.normpath(local_path)
+        remote_path = remote_path.replace('\\\\', '/')
+        
+        try:
+            # Create parent directory once per download run
+            local_dir_path = os.path.dirname(local_path)
+            if local_dir_path not in self._known_dirs:
+                os.makedirs(local_dir_path, exist_ok=True)
+                self._known_dirs.add(local_dir_path)
+            
+            # Download with retry
+            retry_count = 0
+            max_file_retries = 2
+            
+            while True:
                 try:
-                    # Create parent directory if it doesn't exist
-                    local_dir_path = os.path.dirname(local_path)
-                    if not os.path.exists(local_dir_path):
-                        os.makedirs(local_dir_path)
+                    self.logger.debug(f"SFTP: Attempting download of {remote_path}, attempt {retry_count+1}")
+                    # Pooled channel, validated on borrow, so a retry gets a fresh one
+                    with self.ssh_client.borrow_sftp() as sftp:
+                        if not sftp:
+                            raise IOError("Could not borrow SFTP channel")
+                        file_size = sftp.stat(remote_path).st_size  # Verify existence
+                        transferred = 0
+                        
+                        # Large local buffer so writes are flushed in MB-sized syscalls
+                        with open(local_path, 'wb', buffering=8 * 1024 * 1024) as local_file:
+                            with sftp.open(remote_path, 'rb') as remote_file:
+                                # Keep many READ requests in flight instead of one per round-trip
+                                remote_file.prefetch(file_size)
+                                while True:
+                                    chunk = remote_file.read(1024 * 1024)
+                                    if not chunk:
+                                        break
+                                    local_file.write(chunk)
+                                    transferred += len(chunk)
+                                    self._download_progress(transferred, file_size, file_name,
+                                                            remote_path, local_path, on_progress)
+                        
+                        if file_size == 0:
+                            self._download_progress(0, 0, file_name, remote_path, local_path, on_progress)
                     
-                    # Download with retry
-                    retry_count = 0
-                    max_file_retries = 2
-                    file_downloaded = False
-                    
-                    while not file_downloaded and retry_count <= max_file_retries:
-                        try:
-                            self.logger.debug(f"SFTP: Attempting download of {remote_path}, attempt {retry_count+1}")
-                            sftp.stat(remote_path)  # Verify existence
-                            sftp.get(remote_path, local_path, callback=lambda current, total, 
-                                    fn=file_name, rp=remote_path, lp=local_path: 
-                                    self._download_progress(current, total, fn, rp, lp, on_progress))
-                            
-                            file_downloaded = True
-                            downloaded_files += 1
-                            self.logger.debug(f"SFTP: Downloaded {remote_path}")
-                        except Exception as dl_e:
-                            retry_count += 1
-                            self.logger.log(f"SFTP: Download attempt {retry_count} failed for {remote_path}: {str(dl_e)}")
-                            if retry_count <= max_file_retries:
-                                time.sleep(1)  # Brief pause before retry
-                                try:
-                                    # Try to refresh SFTP connection
-                                    sftp = self.ssh_client.get_sftp_client()
-                                except Exception:
-                                    pass
-                            else:
-                                raise  # Re-raise to be caught by outer exception handler
-                
-                except Exception as e:
-                    failed_files += 1
-                    self.logger.log(f"SFTP: Error downloading {remote_path}: {str(e)}", level='error')'''
-    
-    # Replace the download attempt block with retry logic
-    content = re.sub(
-        r'try:\s+local_dir_path = os\.path\.dirname\(local_path\).*?self\.logger\.debug\(f"SFTP: Downloaded \{remote_path\}"\)\s+except Exception as e:.*?self\.logger\.log\(f"SFTP: Exception re-establishing SFTP: \{recon_e\}", level=\'error\'\)',
-        file_retry_logic,
-        content,
-        flags=re.DOTALL
-    )
+                    self.logger.debug(f"SFTP: Downloaded {remote_path}")
+                    return True
+                except Exception as dl_e:
+                    retry_count += 1
+                    self.logger.log(f"SFTP: Download attempt {retry_count} failed for {remote_path}: {str(dl_e)}")
+                    if retry_count > max_file_retries:
+                        raise  # Re-raise to be caught by outer exception handler
+                    time.sleep(1)  # Brief pause before retry
+        
+        except Exception as e:
+            self.logger.log(f"SFTP: Error downloading {remote_path}: {str(e)}", level='error')
+            return False
+'''
+    
+    if 'def _download_one(' not in content:
+        content = content.replace(
+            '    def _download_progress(',
+            download_one.lstrip('\n') + '\n    def _download_progress(',
+            1
+        )
+    
+    # Directories created by _download_one, reset per download_files call
+    if 'self._known_dirs = set()' not in content:
+        content = content.replace(
+            '        # Path tracking\n',
+            '        # Local directories already created during the current download\n'
+            '        self._known_dirs = set()\n'
+            '        \n'
+            '        # Path tracking\n',
+            1
+        )
+        content = content.replace(
+            '        def download_thread():\n',
+            '        self._known_dirs.clear()\n'
+            '        \n'
+            '        def download_thread():\n',
+            1
+        )
+    
+    # Last progress report time per file, used to throttle _download_progress
+    if 'self._last_prog = {}' not in content:
+        content = content.replace(
+            '        # Path tracking\n',
+            '        # Last progress report time per file name\n'
+            '        self._last_prog = {}\n'
+            '        \n'
+            '        # Path tracking\n',
+            1
+        )
+        content = content.replace(
+            '        self._known_dirs.clear()\n',
+            '        self._known_dirs.clear()\n'
+            '        self._last_prog.clear()\n',
+            1
+        )
+    
+    if 'from concurrent.futures import' not in content:
+        content = content.replace(
+            'import threading\n',
+            'import threading\nfrom concurrent.futures import ThreadPoolExecutor, as_completed\n',
+            1
+        )
     
     # Fix progress callback to ensure UI updates on main thread
     progress_callback = '''
+    # MYFORGE_FIX_V1
     def _download_progress(self, transferred, total, filename, remote_path, local_path, callback=None):
-        """Handle download progress updates"""
+        """Handle download progress updates, throttled to 20 per second per file"""
+        now = time.monotonic()
+        done = transferred >= total
+        
+        # Skip intermediate updates, but always report completion
+        if not done and now - self._last_prog.get(filename, 0.0) < 0.05:
+            return
+        self._last_prog[filename] = now
+        
         if total == 0:  # Avoid division by zero
             percent = 100
         else:
@@ -116,56 +240,49 @@ def fix_sftp_py():
             callback(filename, transferred, total, percent)
     '''
     
-    # Replace the progress method with improved one
-    content = re.sub(
-        r'def _download_progress\(self, transferred, total, filename, remote_path, local_path, callback=None\):.*?if callback:.*?callback\(filename, transferred, total, percent\)',
-        progress_callback,
-        content,
-        flags=re.DOTALL
-    )
+    # Replace the connection check with retry logic, the sequential download
+    # loop with the parallel one and the progress method with the improved one
+    content = _sub_fixes(_SFTP_FIXES_RE, {
+        'connect': connection_logic,
+        'download_loop': file_retry_logic,
+        'download_progress': progress_callback,
+    }, content)
     
-    with open(sftp_path, 'w') as f:
-        f.write(content)
-    
-    print(f"Fixed {sftp_path}")
+    if _write_if_changed(sftp_path, original, content):
+        print(f"Fixed {sftp_path}")
 
 def fix_file_explorer_tab_py():
     """Fix issues in file_explorer_tab.py"""
     tab_path = os.path.join("ui", "file_explorer_tab.py")
     
-    with open(tab_path, 'r') as f:
-        content = f.read()
-    
-    # Ensure progress updates happen on main thread
-    content = re.sub(
-        r'def on_progress\(filename, transferred, total, percent\):.*?progress_dialog\.update_progress\(',
-        'def on_progress(filename, transferred, total, percent):\n            # Ensure UI updates happen on the main thread\n            self.frame.after(0, lambda: progress_dialog.update_progress(',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # Add error handling for SFTP operations
-    content = re.sub(
-        r'# Start download.*?self\.sftp_ops\.download_files\(',
-        '# Start download with error handling\n        try:\n            self.sftp_ops.download_files(',
-        content,
-        flags=re.DOTALL
-    )
+    content = _read_source(tab_path)
+    if FIX_MARKER in content:
+        print(f"{tab_path} already fixed")
+        return
+    original = content
     
-    with open(tab_path, 'w') as f:
-        f.write(content)
+    # Ensure progress updates happen on main thread, and add error handling for SFTP operations
+    content = _sub_fixes(_TAB_FIXES_RE, {
+        'on_progress': 'def on_progress(filename, transferred, total, percent):\n            # MYFORGE_FIX_V1\n            # Ensure UI updates happen on the main thread\n            self.frame.after(0, lambda: progress_dialog.update_progress(',
+        'start_download': '# Start download with error handling\n        # MYFORGE_FIX_V1\n        try:\n            self.sftp_ops.download_files(',
+    }, content)
     
-    print(f"Fixed {tab_path}")
+    if _write_if_changed(tab_path, original, content):
+        print(f"Fixed {tab_path}")
 
 def fix_client_py():
     """Fix issues in client.py"""
     client_path = os.path.join("ssh", "client.py")
     
-    with open(client_path, 'r') as f:
-        content = f.read()
+    content = _read_source(client_path)
+    if FIX_MARKER in content:
+        print(f"{client_path} already fixed")
+        return
+    original = content
     
     # Improve SFTP client handling
     better_sftp = '''
+    # MYFORGE_FIX_V1
     def get_sftp_client(self):
         """Get or create SFTP client with error handling"""
         if not self.connected:
@@ -187,21 +304,19 @@ def fix_client_py():
     '''
     
     # Replace the get_sftp_client method with improved one
-    content = re.sub(
-        r'def get_sftp_client\(self\):.*?return None',
+    content = _GET_SFTP_CLIENT_RE.sub(
         better_sftp,
-        content,
-        flags=re.DOTALL
+        content
     )
     
-    with open(client_path, 'w') as f:
-        f.write(content)
-    
-    print(f"Fixed {client_path}")
+    if _write_if_changed(client_path, original, content):
+        print(f"Fixed {client_path}")
 
 if __name__ == "__main__":
     print("Applying fixes to MyForge Terminal...")
-    fix_sftp_py()
-    fix_file_explorer_tab_py()
-    fix_client_py()
+    # The three fixes touch independent files, so they can run side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(fix) for fix in (fix_sftp_py, fix_file_explorer_tab_py, fix_client_py)]
+        for future in futures:
+            future.result()
     print("Fixes completed! Please restart the application.")
\ No newline at end of file
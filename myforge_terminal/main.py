@@ -11,6 +11,7 @@ Structure:
 
 import os
 import sys
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 
@@ -24,10 +25,8 @@ from utils.logger import Logger
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import paramiko
-        return True
-    except ImportError:
+    # Only locate the package here; it is imported on first connect
+    if importlib.util.find_spec("paramiko") is None:
         messagebox.showerror(
             "Missing Dependencies",
             "Required package 'paramiko' is not installed.\n\n"
@@ -35,6 +34,7 @@ def check_dependencies():
             "pip install paramiko"
         )
         return False
+    return True
 
 def main():
     """Main entry point for the application"""
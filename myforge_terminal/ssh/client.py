@@ -11,6 +11,8 @@ Structure:
       - disconnect(self, on_complete_callback=None)
       - send_command(self, command, store_in_history=True)
       - get_sftp_client(self)
+      - borrow_sftp(self)
+      - release_sftp(self, sftp)
       - close_sftp(self)
 """
 
@@ -18,9 +20,18 @@ import threading
 import socket
 import time
 import re
-import paramiko
+import queue
+import contextlib
+import codecs
 from utils.logger import Logger
 
+# Seconds to wait for each address's TCP connect before trying the next one
+_CONNECT_TIMEOUT = 15
+
+# Precompiled patterns for the per-line output scan in _process_output_line
+_PID_RE = re.compile(r'process ID[:=\s]*(\d+)', re.IGNORECASE)
+_LOAD_RE = re.compile(r'load average:\s*([0-9.]+),\s*([0-9.]+),\s*([0-9.]+)')
+
 class SSHClient:
     def __init__(self, config, logger):
         """Initialize SSH client with configuration and logger"""
@@ -29,10 +40,23 @@ class SSHClient:
         self.disconnect_lock = threading.Lock()
         
         # Connection objects
+        self._paramiko = None  # Imported on first connect()
         self.client = None
         self.shell = None
         self.sftp = None
         
+        # Pool of SFTP channels multiplexed over the same transport, idle channels are
+        # queued as (channel, time released)
+        self.sftp_pool_size = 4
+        self.sftp_pool = queue.Queue(maxsize=self.sftp_pool_size)
+        self.sftp_pool_idle_check = 10.0  # Channels idle longer than this are checked before reuse
+        self.sftp_pool_lock = threading.Lock()
+        self._sftp_pool_count = 0  # Channels opened for the pool (idle + borrowed)
+        
+        # Outgoing shell data, flushed to the channel once per logical batch
+        self._send_buf = bytearray()
+        self._send_lock = threading.Lock()
+        
         # Connection state
         self.connected = False
         self.hostname = None
@@ -46,6 +70,9 @@ class SSHClient:
         
         # Process management
         self.known_processes = {}  # Store PIDs of launched processes
+        
+        # Set to wake and stop background loops (system monitor) on disconnect
+        self._stop_event = threading.Event()
 
     def connect(self, hostname, username, port=22, password=None, key_path=None, on_complete=None):
         """
@@ -64,6 +91,25 @@ class SSHClient:
         self.port = port
         
         def connect_thread():
+            # Deferred import keeps paramiko's startup cost off application launch, and
+            # doing it on this thread keeps it off the Tk thread on the first connect. A
+            # broken install (e.g. a bad cryptography build) only fails here, report it like
+            # any other connection failure. Kept apart from the try below, whose except
+            # clauses need paramiko
+            if self._paramiko is None:
+                try:
+                    import paramiko
+                    self._paramiko = paramiko
+                except Exception as e:
+                    error_message = f"Connection error: could not load paramiko: {str(e)}"
+                    self.logger.log(error_message)
+                    if self.on_status_change:
+                        self.on_status_change("Connection failed")
+                    if on_complete:
+                        on_complete(False, error_message)
+                    return
+            paramiko = self._paramiko
+            
             success = False
             error_message = None
             
@@ -96,15 +142,44 @@ class SSHClient:
                         on_complete(False, error_message)
                     return
                 
+                # Open the TCP socket ourselves so it can be tuned before connecting:
+                # buffers must be set pre-connect for window scaling to use them. Every
+                # resolved address is tried in turn, like socket.create_connection
+                sock = None
+                last_error = None
+                for family, socktype, proto, _, address in socket.getaddrinfo(hostname, port, 0, socket.SOCK_STREAM):
+                    candidate = socket.socket(family, socktype, proto)
+                    try:
+                        candidate.settimeout(_CONNECT_TIMEOUT)
+                        candidate.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # No Nagle delay on keystrokes
+                        candidate.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32 * 1024 * 1024)
+                        candidate.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 32 * 1024 * 1024)
+                        candidate.connect(address)
+                        sock = candidate
+                        break
+                    except OSError as e:
+                        candidate.close()
+                        last_error = e
+                
+                if sock is None:
+                    raise last_error
+                connect_params["sock"] = sock
+                
                 # Attempt connection
                 self.client.connect(**connect_params)
                 
+                # Larger channel window/packets so SFTP transfers are not window-bound
+                transport = self.client.get_transport()
+                transport.default_window_size = 2 ** 27
+                transport.default_max_packet_size = 2 ** 19
+                
                 # Get shell and SFTP channels
                 self.shell = self.client.invoke_shell()
                 self.shell.settimeout(0.1)  # Small timeout for non-blocking reads
                 
                 # Successful connection
                 self.connected = True
+                self._stop_event.clear()
                 
                 # Start output reading thread
                 threading.Thread(target=self._read_output, daemon=True).start()
@@ -159,6 +234,7 @@ class SSHClient:
 
         self.logger.log(f"Initiating disconnect from {self.hostname}...")
         self.connected = False  # Signal other threads to stop
+        self._stop_event.set()  # Wake the system monitor immediately
 
         def disconnect_thread_worker():
             try:
@@ -188,6 +264,9 @@ class SSHClient:
                         self.logger.log(f"Error closing SFTP: {str(e)}")
                         resources_closed_properly = False
                 
+                if not self._drain_sftp_pool():
+                    resources_closed_properly = False
+                
                 current_client = self.client
                 self.client = None # Nullify before closing
                 if current_client:
@@ -239,7 +318,8 @@ class SSHClient:
                 return self._handle_process_kill(command)
                 
             # Send command
-            self.shell.send(command + "\n")
+            self._queue_send(command + "\n")
+            self._flush_send()
             
             # Log command
             self.logger.log(f"Command: {command}")
@@ -252,6 +332,21 @@ class SSHClient:
             self.logger.log(f"Error sending command: {str(e)}")
             return False
 
+    def _queue_send(self, text):
+        """Append text to the outgoing shell buffer without sending it yet"""
+        with self._send_lock:
+            self._send_buf += text.encode('utf-8')
+    
+    def _flush_send(self):
+        """Send all buffered shell data in a single channel write"""
+        with self._send_lock:
+            if not self._send_buf:
+                return
+            try:
+                self.shell.sendall(bytes(self._send_buf))
+            finally:
+                self._send_buf.clear()
+    
     def _handle_process_kill(self, command):
         """Handle special kill-process command"""
         try:
@@ -261,7 +356,8 @@ class SSHClient:
                 return False
             
             pid = parts[1].strip()
-            self.shell.send(f"kill {pid}\n")
+            self._queue_send(f"kill {pid}\n")
+            self._flush_send()
             self.logger.log(f"Killed process with PID: {pid}")
             
             # Remove from known processes
@@ -279,35 +375,40 @@ class SSHClient:
 
     def _read_output(self):
         """Read output from SSH shell channel"""
-        buffer = ""
+        recv_tail = b''  # Incomplete trailing line, kept as raw bytes
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
         
         # Check self.shell and self.shell.closed more robustly
         while self.connected and self.shell and not self.shell.closed:
             try:
                 if self.shell.recv_ready():
-                    data = self.shell.recv(4096).decode('utf-8', errors='replace')
-                    if not data: # Connection might have been closed by server
+                    raw = self.shell.recv(65536)
+                    if not raw: # Connection might have been closed by server
                         if not self.shell.closed: # Check if shell is actually closed
                              time.sleep(0.01) # Small pause if no data but shell not marked closed
                         continue
                     
-                    # Send output to callback
-                    if self.on_output:
-                        self.on_output(data)
+                    # Send output to callback (decoder holds back split multibyte sequences)
+                    text = decoder.decode(raw)
+                    if text and self.on_output:
+                        self.on_output(text)
+                    
+                    # Process complete lines for special patterns, scanning raw bytes
+                    data = recv_tail + raw
+                    idx = data.rfind(b'\n')
+                    if idx < 0:
+                        recv_tail = data
+                        continue
                     
-                    # Process output for special patterns
-                    buffer += data
-                    if '\n' in buffer:
-                        lines = buffer.split('\n')
-                        buffer = lines[-1]  # Keep incomplete line
-                        
-                        for line in lines[:-1]:
-                            self._process_output_line(line)
+                    complete, recv_tail = data[:idx + 1], data[idx + 1:]
+                    for line in complete.decode('utf-8', errors='replace').split('\n')[:-1]:
+                        self._process_output_line(line)
                 
                 # Check if shell closed by remote end or due to error
                 elif self.shell.exit_status_ready() or self.shell.closed:
                     self.logger.log("Shell exit status ready or shell closed, terminating output reading.")
                     self.connected = False # Ensure loop terminates
+                    self._stop_event.set()
                     break
             
             except socket.timeout:
@@ -331,18 +432,24 @@ class SSHClient:
 
     def _process_output_line(self, line):
         """Process a single line of output for special patterns"""
+        stripped = line.rstrip()
+        if not stripped:
+            return
+        
         # Look for process IDs in output
-        if "server started" in line.lower() or "uvicorn" in line.lower():
-            pid_match = re.search(r'process ID[:=\s]*(\d+)', line, re.IGNORECASE)
+        line_lower = line.lower()
+        is_uvicorn = "uvicorn" in line_lower
+        if is_uvicorn or "server started" in line_lower:
+            pid_match = _PID_RE.search(line)
             if pid_match:
                 pid = pid_match.group(1)
-                process_name = "uvicorn" if "uvicorn" in line.lower() else "server"
+                process_name = "uvicorn" if is_uvicorn else "server"
                 self.known_processes[process_name] = pid
                 self.logger.log(f"Detected {process_name} process with PID: {pid}")
         
         # Extract CPU info from 'uptime'
         if "load average:" in line:
-            match = re.search(r'load average:\s*([0-9.]+),\s*([0-9.]+),\s*([0-9.]+)', line)
+            match = _LOAD_RE.search(line)
             if match:
                 load1 = match.group(1)
                 self._update_system_stat("cpu", f"CPU Load: {load1}")
@@ -353,9 +460,12 @@ class SSHClient:
             if len(parts) >= 4:  # Need at least Mem:, total, used, free
                 total_mem, used_mem = parts[1], parts[2]
                 self._update_system_stat("memory", f"Memory: {used_mem}/{total_mem}")
+            return
         
-        # Extract disk info
-        parts = line.split()
+        # Extract disk info (only lines ending in the root mount point are worth splitting)
+        if not stripped.endswith("/"):
+            return
+        parts = stripped.split()
         if len(parts) >= 5 and parts[-1] == "/":
             disk_usage_percent = parts[-2]  # Percentage used
             used_disk, total_disk = parts[2], parts[1]  # Used and Total
@@ -382,22 +492,16 @@ class SSHClient:
                 # Send commands to check system status
                 # Ensure shell is usable before sending
                 if self.shell and not self.shell.closed and self.shell.send_ready():
-                    self.shell.send("uptime\n")
-                    time.sleep(0.2) # Give time for command to be processed
-                    if not (self.connected and self.shell and not self.shell.closed and self.shell.send_ready()): break
-                    self.shell.send("free -h | grep '^Mem:'\n")
-                    time.sleep(0.2)
-                    if not (self.connected and self.shell and not self.shell.closed and self.shell.send_ready()): break
-                    self.shell.send("df -h / | tail -n 1\n")
+                    # All three status commands in a single line and channel write
+                    self._queue_send("uptime; free -h | grep '^Mem:'; df -h / | tail -n 1\n")
+                    self._flush_send()
                 else:
                     self.logger.log("System monitor: Shell not ready or closed, skipping command send.")
                     break # Exit if shell is not usable
                 
-                # Wait for next update
-                for _ in range(interval):
-                    if not self.connected or (self.shell and self.shell.closed):
-                        break
-                    time.sleep(1)
+                # Wait for next update, returns early when disconnect sets the event
+                if self._stop_event.wait(interval):
+                    break
             except Exception as e:
                 if self.connected and self.shell and not self.shell.closed : # Log error only if we expected to be active
                     self.logger.log(f"Error in system monitoring: {e}")
@@ -433,11 +537,115 @@ class SSHClient:
             self.logger.log(f"Error creating SFTP client: {str(e)}")
             return None
     
+    @contextlib.contextmanager
+    def borrow_sftp(self):
+        """
+        Check out a pooled SFTP channel for the duration of a with-block
+        
+        Yields None if no channel could be obtained, mirroring get_sftp_client.
+        """
+        sftp = self._acquire_pooled_sftp()
+        try:
+            yield sftp
+        finally:
+            self.release_sftp(sftp)
+    
+    def release_sftp(self, sftp):
+        """Return a borrowed SFTP channel to the pool"""
+        if sftp is None:
+            return
+        
+        if not self.connected or sftp.sock.closed:
+            self._discard_pooled_sftp(sftp)
+            return
+        
+        try:
+            self.sftp_pool.put_nowait((sftp, time.monotonic()))
+        except queue.Full:
+            self._discard_pooled_sftp(sftp)
+    
+    def _acquire_pooled_sftp(self):
+        """Take an idle pooled channel, opening a new one while below pool size"""
+        while self.connected:
+            try:
+                sftp, released_at = self.sftp_pool.get_nowait()
+            except queue.Empty:
+                with self.sftp_pool_lock:
+                    can_open = self._sftp_pool_count < self.sftp_pool_size
+                    if can_open:
+                        self._sftp_pool_count += 1
+                
+                if can_open:
+                    return self._open_pooled_sftp()
+                
+                # Pool exhausted, wait for another thread to release a channel for as long as
+                # the connection lasts. Waking up regularly re-checks that, and picks up a
+                # slot freed by a discarded channel
+                try:
+                    sftp, released_at = self.sftp_pool.get(timeout=1)
+                except queue.Empty:
+                    continue
+            
+            # A channel handed back moments ago is alive, the operation's own error handling
+            # covers the rare exception. Only one left idle for a while costs a round-trip
+            if time.monotonic() - released_at < self.sftp_pool_idle_check and not sftp.sock.closed:
+                return sftp
+            
+            try:
+                sftp.normalize('.')
+                return sftp
+            except Exception as e:
+                self.logger.log(f"Discarding dead pooled SFTP channel: {str(e)}")
+                self._discard_pooled_sftp(sftp)
+        
+        return None
+    
+    def _open_pooled_sftp(self):
+        """Open a new SFTP channel for the pool (slot already reserved)"""
+        try:
+            sftp = self.client.open_sftp()
+            sftp.sock.settimeout(30)  # 30 second timeout for operations
+            return sftp
+        except Exception as e:
+            with self.sftp_pool_lock:
+                self._sftp_pool_count -= 1
+            self.logger.log(f"Error opening pooled SFTP channel: {str(e)}")
+            return None
+    
+    def _discard_pooled_sftp(self, sftp):
+        """Close a pooled channel and free its slot"""
+        with self.sftp_pool_lock:
+            self._sftp_pool_count -= 1
+        try:
+            sftp.close()
+        except Exception:
+            pass
+    
+    def _drain_sftp_pool(self):
+        """Close all idle pooled SFTP channels"""
+        closed_properly = True
+        while True:
+            try:
+                sftp, _ = self.sftp_pool.get_nowait()
+            except queue.Empty:
+                break
+            
+            with self.sftp_pool_lock:
+                self._sftp_pool_count -= 1
+            try:
+                sftp.close()
+            except Exception as e:
+                self.logger.log(f"Error closing pooled SFTP channel: {str(e)}")
+                closed_properly = False
+        return closed_properly
+    
     def close_sftp(self):
-        """Close SFTP connection if open"""
+        """Close SFTP connections if open"""
         if self.sftp:
             try:
                 self.sftp.close()
                 self.sftp = None
             except Exception as e:
-                self.logger.log(f"Error closing SFTP: {str(e)}")
\ No newline at end of file
+                self.logger.log(f"Error closing SFTP: {str(e)}")
+        
+        self._drain_sftp_pool()
\ No newline at end of file
@@ -8,24 +8,45 @@ Structure:
       Description: Initialize SFTP operations with SSH client and logger
       - __init__(self, ssh_client, logger)
       - list_directory(self, remote_path=None, on_complete=None)
+      - list_directory_stream(self, remote_path=None, on_batch=None, on_complete=None)
+      - list_directory_background(self, remote_path, on_complete=None)
       - download_files(self, items, local_dir, on_progress=None, on_complete=None)
       - upload_files(self, local_files, remote_dir, overwrite=False, on_progress=None, on_complete=None)
+      - download_tree_fast(self, remote_dir, local_dir, on_complete=None)
+      - upload_tree_fast(self, local_dir, remote_dir, on_complete=None)
       - create_directory(self, remote_parent_dir, new_dir_name, on_complete=None)
       - delete_item(self, item, on_complete=None)
+      - delete_items(self, items, on_complete=None)
       - rename_item(self, item, new_name, on_complete=None)
       - get_file_content(self, remote_path, on_complete=None)
+      - get_file_head(self, remote_path, max_bytes, on_complete=None)
       - save_file_content(self, remote_path, content, on_complete=None)
+      - start_progress_pump(self, root)
+      - close(self)
 """
 
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import posixpath
+import queue
+import shlex
 import stat
+import tarfile
 import time
-from datetime import datetime
 import tkinter as tk
 from tkinter import messagebox
 
+# Buffer size for SFTP file handles, one full SFTP request (paramiko defaults to 8 KB)
+SFTP_BUF = 32768
+
+# Shell exit status when a command (here tar) is missing
+_COMMAND_NOT_FOUND = 127
+
+# Server-supplied archives are only extracted where tarfile can filter them (3.12+ and the
+# security backports), older versions download trees over SFTP instead
+_TAR_DATA_FILTER = getattr(tarfile, 'data_filter', None)
+
 class SFTPOperations:
     def __init__(self, ssh_client, logger):
         """Initialize SFTP operations with SSH client and logger"""
@@ -37,6 +58,33 @@ class SFTPOperations:
         self.on_status_change = None
         self.on_operation_complete = None
         
+        # Shared worker pool for all operations, caps concurrent SFTP use
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='sftp-op')
+        
+        # Outstanding read requests per prefetched file, like OpenSSH sftp -R 64
+        self.max_concurrent_requests = 64
+        
+        # Files above the threshold are downloaded as concurrent byte ranges
+        self.parallel_get_threshold = 64 * 1024 * 1024
+        self.parallel_get_streams = 4
+        
+        # Progress events from transfer workers, delivered on the Tk thread once
+        # start_progress_pump is called
+        self._progress_q = queue.Queue()
+        self._progress_root = None
+        
+        # Completion callbacks, run on the Tk thread after pending progress
+        self._complete_q = queue.SimpleQueue()
+        
+        # paramiko's SFTPClient is not thread-safe, so tasks using the shared client run one
+        # at a time on their own thread, see _submit. Transfers use pooled channels on
+        # _executor instead, so queued shared-client tasks never hold up its workers
+        self._sftp_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sftp-shared')
+        
+        # sftp.normalize('/') for the server it was resolved on
+        self._normalized_root = None
+        self._normalized_root_server = None
+        
         # Path tracking
         self.default_remote_path = "/var/www/myforge.ai"
         self.current_remote_path = self.default_remote_path
@@ -53,10 +101,9 @@ class SFTPOperations:
             remote_path = self.current_remote_path
         
         def list_thread():
-            sftp = self.ssh_client.get_sftp_client()
+            sftp = self._get_sftp()
             if not sftp:
-                if on_complete:
-                    on_complete(False, [], "Could not establish SFTP connection")
+                self._complete(on_complete, False, [], "Could not establish SFTP connection")
                 return
             
             try:
@@ -65,61 +112,28 @@ class SFTPOperations:
                 if self.on_status_change:
                     self.on_status_change(f"Listing {remote_path}...")
                 
-                # Get directory contents with attributes
-                dir_items = sftp.listdir_attr(remote_path)
+                # Stream directory contents with attributes, keeping several READDIR requests in flight
+                dir_items = sftp.listdir_iter(remote_path)
                 
                 # Process items
                 items = []
                 
                 # Add parent directory entry if not at root
-                if remote_path != '/' and remote_path != sftp.normalize('/'):
-                    parent_path = posixpath.normpath(posixpath.join(remote_path, '..'))
-                    if parent_path != remote_path:  # Avoid '..' if it leads to the same dir
-                        items.append({
-                            'name': '..',
-                            'path': parent_path,
-                            'type': 'directory',
-                            'size': 0,
-                            'modified': 0,
-                            'permissions': '',
-                            'is_parent': True
-                        })
+                parent = self._parent_entry(sftp, remote_path)
+                if parent:
+                    items.append(parent)
                 
                 # Sort directories first, then files
                 dirs = []
                 files = []
                 
+                # Plain concatenation instead of posixpath.join per entry
+                path_prefix = remote_path.rstrip('/') + '/'
+                
                 for item in dir_items:
-                    full_path = posixpath.join(remote_path, item.filename)
+                    item_info = self._listing_entry(path_prefix, item)
                     
-                    # Get file type
-                    if stat.S_ISDIR(item.st_mode):
-                        item_type = 'directory'
-                    elif stat.S_ISLNK(item.st_mode):
-                        item_type = 'link'
-                    else:
-                        item_type = 'file'
-                    
-                    # Format permissions string
-                    perm_string = self._format_permissions(item.st_mode)
-                    
-                    # Convert modification time
-                    try:
-                        mod_time = datetime.fromtimestamp(item.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    except:
-                        mod_time = 'Unknown'
-                    
-                    item_info = {
-                        'name': item.filename,
-                        'path': full_path,
-                        'type': item_type,
-                        'size': item.st_size,
-                        'modified': mod_time,
-                        'permissions': perm_string,
-                        'is_parent': False
-                    }
-                    
-                    if item_type == 'directory':
+                    if item_info['type'] == 'directory':
                         dirs.append(item_info)
                     else:
                         files.append(item_info)
@@ -140,8 +154,7 @@ class SFTPOperations:
                     self.on_status_change(f"Connected to {self.ssh_client.hostname}")
                 
                 # Call completion callback
-                if on_complete:
-                    on_complete(True, items, None)
+                self._complete(on_complete, True, items, None)
                 
                 self.logger.log(f"Listed directory {remote_path}: {len(items)} items")
                 
@@ -152,11 +165,184 @@ class SFTPOperations:
                 if self.on_status_change:
                     self.on_status_change(f"Error listing directory")
                 
-                if on_complete:
-                    on_complete(False, [], error_msg)
+                self._complete(on_complete, False, [], error_msg)
+        
+        # Run on the shared SFTP client's thread
+        self._submit(list_thread)
+    
+    def list_directory_stream(self, remote_path=None, on_batch=None, on_complete=None):
+        """
+        List a remote directory, delivering entries in batches as they arrive
+        
+        Args:
+            remote_path (str, optional): Remote path to list. Defaults to current path.
+            on_batch (callable): Callback with (entries) for each batch, in server order
+            on_complete (callable): Callback with (success, items, error) parameters, items sorted
+                like list_directory
+        """
+        if remote_path is None:
+            remote_path = self.current_remote_path
+        
+        def stream_thread():
+            sftp = self._get_sftp()
+            if not sftp:
+                self._complete(on_complete, False, [], "Could not establish SFTP connection")
+                return
+            
+            try:
+                self.logger.log(f"Listing directory: {remote_path}")
+                
+                if self.on_status_change:
+                    self.on_status_change(f"Listing {remote_path}...")
+                
+                dirs = []
+                files = []
+                batch = []
+                
+                parent = self._parent_entry(sftp, remote_path)
+                if parent:
+                    batch.append(parent)
+                
+                path_prefix = remote_path.rstrip('/') + '/'
+                last_flush = time.monotonic()
+                
+                # listdir_iter yields each READDIR reply as it lands, flush what has
+                # arrived every 50 ms or 500 entries so the first rows show after one round-trip
+                for item in sftp.listdir_iter(remote_path):
+                    item_info = self._listing_entry(path_prefix, item)
+                    batch.append(item_info)
+                    
+                    if item_info['type'] == 'directory':
+                        dirs.append(item_info)
+                    else:
+                        files.append(item_info)
+                    
+                    now = time.monotonic()
+                    if len(batch) >= 500 or now - last_flush >= 0.05:
+                        self._complete(on_batch, batch)
+                        batch = []
+                        last_flush = now
+                
+                if batch:
+                    self._complete(on_batch, batch)
+                
+                dirs.sort(key=lambda x: x['name'].lower())
+                files.sort(key=lambda x: x['name'].lower())
+                
+                items = [parent] if parent else []
+                items.extend(dirs)
+                items.extend(files)
+                
+                self.current_remote_path = remote_path
+                
+                if self.on_status_change:
+                    self.on_status_change(f"Connected to {self.ssh_client.hostname}")
+                
+                self._complete(on_complete, True, items, None)
+                
+                self.logger.log(f"Listed directory {remote_path}: {len(items)} items")
+            
+            except Exception as e:
+                error_msg = f"Error listing directory {remote_path}: {str(e)}"
+                self.logger.log(error_msg)
+                
+                if self.on_status_change:
+                    self.on_status_change(f"Error listing directory")
+                
+                self._complete(on_complete, False, [], error_msg)
         
-        # Run in a separate thread
-        threading.Thread(target=list_thread, daemon=True).start()
+        self._submit(stream_thread)
+    
+    def list_directory_background(self, remote_path, on_complete=None):
+        """
+        List a remote directory for caching, without touching the current path, status or log
+        
+        Runs on a pooled channel so background listings never wait for the shared client.
+        
+        Args:
+            remote_path (str): Remote path to list
+            on_complete (callable): Callback with (success, items, error) parameters, items sorted
+                like list_directory
+        """
+        def background_list_thread():
+            with self.ssh_client.borrow_sftp() as sftp:
+                if not sftp:
+                    self._complete(on_complete, False, [], "Could not borrow SFTP channel")
+                    return
+                
+                try:
+                    dirs = []
+                    files = []
+                    path_prefix = remote_path.rstrip('/') + '/'
+                    
+                    for item in sftp.listdir_iter(remote_path):
+                        item_info = self._listing_entry(path_prefix, item)
+                        if item_info['type'] == 'directory':
+                            dirs.append(item_info)
+                        else:
+                            files.append(item_info)
+                    
+                    dirs.sort(key=lambda x: x['name'].lower())
+                    files.sort(key=lambda x: x['name'].lower())
+                    
+                    parent = self._parent_entry(sftp, remote_path)
+                    items = [parent] if parent else []
+                    items.extend(dirs)
+                    items.extend(files)
+                    
+                    self._complete(on_complete, True, items, None)
+                
+                except Exception as e:
+                    self._complete(on_complete, False, [], f"Error listing directory {remote_path}: {str(e)}")
+        
+        # Pooled channel, so no need for the shared client lock
+        self._executor.submit(background_list_thread)
+    
+    def _parent_entry(self, sftp, remote_path):
+        """Return the '..' listing entry for remote_path, or None at the root"""
+        # Normalized root only changes with the server, so resolve it once per host
+        server = (self.ssh_client.hostname, self.ssh_client.port)
+        if self._normalized_root_server != server:
+            self._normalized_root = sftp.normalize('/')
+            self._normalized_root_server = server
+        
+        if remote_path == '/' or remote_path == self._normalized_root:
+            return None
+        
+        parent_path = posixpath.normpath(posixpath.join(remote_path, '..'))
+        if parent_path == remote_path:  # Avoid '..' if it leads to the same dir
+            return None
+        
+        return {
+            'name': '..',
+            'path': parent_path,
+            'type': 'directory',
+            'size': 0,
+            'mtime': None,
+            'mode': None,
+            'is_parent': True
+        }
+    
+    @staticmethod
+    def _listing_entry(path_prefix, attr):
+        """Build a listing entry from an SFTPAttributes, raw values only, the UI formats them"""
+        # Get file type
+        if stat.S_ISDIR(attr.st_mode):
+            item_type = 'directory'
+        elif stat.S_ISLNK(attr.st_mode):
+            item_type = 'link'
+        else:
+            item_type = 'file'
+        
+        # Only the '..' entry carries is_parent, readers default it to False
+        return {
+            'name': attr.filename,
+            'path': path_prefix + attr.filename,
+            'type': item_type,
+            'size': attr.st_size,
+            'mtime': attr.st_mtime,
+            'mode': attr.st_mode
+        }
     
     def download_files(self, items, local_dir, on_progress=None, on_complete=None):
         """
@@ -169,16 +355,15 @@ class SFTPOperations:
             on_complete: Completion callback function
         """
         def download_thread():
-            sftp = self.ssh_client.get_sftp_client()
-            if not sftp:
-                if on_complete:
-                    on_complete(False, 0, 0, "Could not establish SFTP connection")
+            if not self.ssh_client.connected:
+                self._complete(on_complete, False, 0, 0, "Could not establish SFTP connection")
                 return
             
             try:
                 total_files = 0
                 downloaded_files = 0
                 failed_files = 0
+                skipped_files = 0
                 
                 # Count total files (including in subdirectories)
                 files_to_download = []
@@ -190,7 +375,7 @@ class SFTPOperations:
                     
                     if item['type'] == 'directory':
                         # Process directory recursively
-                        self._count_dir_files(sftp, item['path'], files_to_download, dirs_to_create, 
+                        self._count_dir_files(item['path'], files_to_download, dirs_to_create, 
                                              local_dir, item['name'])
                     else:
                         # Add file to download list
@@ -198,90 +383,51 @@ class SFTPOperations:
                         files_to_download.append({
                             'remote_path': item['path'],
                             'local_path': os.path.join(local_dir, item['name']),
-                            'name': item['name']
+                            'name': item['name'],
+                            # Size from the listing saves a stat per file; a link's own size isn't its target's
+                            'size': None if item['type'] == 'link' else item.get('size'),
+                            'mtime': item.get('mtime')
                         })
                 
                 self.logger.log(f"SFTP: Populated dirs_to_create: {dirs_to_create}")
                 self.logger.log(f"SFTP: Populated files_to_download (count: {len(files_to_download)}): {files_to_download}")
                 
-                # Create all necessary directories
-                for dir_path in dirs_to_create:
+                # Create all necessary directories once, parents first; files need no per-file check
+                unique_dirs = {os.path.normpath(dir_path) for dir_path in dirs_to_create}  # Normalize path separators
+                unique_dirs.add(os.path.normpath(local_dir))
+                for dir_path in sorted(unique_dirs, key=len):
                     try:
-                        dir_path = os.path.normpath(dir_path)  # Normalize path separators
-                        if not os.path.exists(dir_path):
-                            os.makedirs(dir_path, exist_ok=True)
-                            self.logger.log(f"SFTP: Created directory {dir_path}")
+                        os.makedirs(dir_path, exist_ok=True)
                     except Exception as e:
                         self.logger.log(f"SFTP: Error creating sub-directory {dir_path}: {str(e)}")
                 
-                # Download files
-                for i, file_info in enumerate(files_to_download):
-                    remote_path = file_info['remote_path'] # Initialize remote_path
-                    local_path = file_info['local_path']
-                    file_name = file_info['name']
-                    
-                    # Fix Windows paths - normalize separators
-                    local_path = os.path.normpath(local_path)
-                    remote_path = remote_path.replace('\\', '/') # Ensure remote_path uses forward slashes
-
-                    if self.on_status_change:
-                        self.on_status_change(f"Downloading {file_name} ({i+1}/{len(files_to_download)})...")
+                # Download files in parallel, each worker on its own pooled SFTP channel
+                with ThreadPoolExecutor(max_workers=self.ssh_client.sftp_pool_size) as executor:
+                    futures = [
+                        executor.submit(self._download_file, file_info, i, len(files_to_download), on_progress)
+                        for i, file_info in enumerate(files_to_download)
+                    ]
                     
-                    try:
-                        # Create parent directory with explicit creation
-                        local_dir_path = os.path.dirname(local_path)
-                        if local_dir_path and not os.path.exists(local_dir_path):
-                            try:
-                                # Use makedirs with exist_ok to handle race conditions
-                                os.makedirs(local_dir_path, exist_ok=True)
-                                self.logger.log(f"SFTP: Created directory structure: {local_dir_path}")
-                            except Exception as dir_e:
-                                self.logger.log(f"SFTP: Error creating directory {local_dir_path}: {str(dir_e)}")
-                                # Continue anyway, maybe the file creation will work
-                        
-                        # Download with retry
-                        retry_count = 0
-                        max_file_retries = 2
-                        file_downloaded = False
-                        
-                        while not file_downloaded and retry_count <= max_file_retries:
-                            try:
-                                self.logger.log(f"SFTP: Attempting download of {remote_path} to {local_path}, attempt {retry_count+1}")
-                                sftp.stat(remote_path)  # Verify existence
-                                sftp.get(remote_path, local_path, callback=lambda current, total, 
-                                        fn=file_name, rp=remote_path, lp=local_path: 
-                                        self._download_progress(current, total, fn, rp, lp, on_progress))
-                                
-                                file_downloaded = True
-                                downloaded_files += 1
-                                self.logger.log(f"SFTP: Downloaded {remote_path} to {local_path}")
-                            except Exception as dl_e:
-                                retry_count += 1
-                                self.logger.log(f"SFTP: Download attempt {retry_count} failed for {remote_path} to {local_path}: {str(dl_e)}")
-                                if retry_count <= max_file_retries:
-                                    time.sleep(1)  # Brief pause before retry
-                                    try:
-                                        # Try to refresh SFTP connection
-                                        sftp = self.ssh_client.get_sftp_client()
-                                    except Exception:
-                                        pass
-                                else:
-                                    raise  # Re-raise to be caught by outer exception handler
-                    
-                    except Exception as e:
-                        failed_files += 1
-                        self.logger.log(f"SFTP: Error downloading remote file '{remote_path}' to local file '{local_path}': {str(e)}")
+                    # Results are tallied on this thread only, so the counters need no lock
+                    for future in as_completed(futures):
+                        result = future.result()
+                        if result == 'downloaded':
+                            downloaded_files += 1
+                        elif result == 'skipped':
+                            skipped_files += 1
+                        else:
+                            failed_files += 1
                 
                 # Final status update
                 success = failed_files == 0
                 status_msg = (f"Download complete: {downloaded_files} files downloaded"
+                              f"{f', {skipped_files} unchanged' if skipped_files > 0 else ''}"
                               f"{f', {failed_files} failed' if failed_files > 0 else ''}")
                 
                 if self.on_status_change:
                     self.on_status_change(status_msg)
                 
-                if on_complete:
-                    on_complete(success, downloaded_files, failed_files, 
+                self._complete(on_complete, success, downloaded_files, failed_files,
                                None if success else "Some files failed to download")
                 
                 self.logger.log(status_msg)
@@ -293,11 +439,10 @@ class SFTPOperations:
                 if self.on_status_change:
                     self.on_status_change("Download failed")
                 
-                if on_complete:
-                    on_complete(False, 0, 0, error_msg)
+                self._complete(on_complete, False, 0, 0, error_msg)
         
-        # Run in a separate thread
-        threading.Thread(target=download_thread, daemon=True).start()
+        # Run on the shared worker pool
+        self._executor.submit(download_thread)
     
     def upload_files(self, local_files, remote_dir, overwrite=False, on_progress=None, on_complete=None):
         """
@@ -311,10 +456,8 @@ class SFTPOperations:
             on_complete: Completion callback function
         """
         def upload_thread():
-            sftp = self.ssh_client.get_sftp_client()
-            if not sftp:
-                if on_complete:
-                    on_complete(False, 0, 0, "Could not establish SFTP connection")
+            if not self.ssh_client.connected:
+                self._complete(on_complete, False, 0, 0, "Could not establish SFTP connection")
                 return
             
             try:
@@ -323,38 +466,31 @@ class SFTPOperations:
                 failed_files = 0
                 skipped_files = 0
                 
-                for i, local_path in enumerate(local_files):
-                    file_name = os.path.basename(local_path)
-                    remote_path = posixpath.join(remote_dir, file_name)
-                    
-                    if self.on_status_change:
-                        self.on_status_change(f"Uploading {file_name} ({i+1}/{total_files})...")
-                    
+                # One listing answers every existence check, not needed when overwriting
+                existing_names = None
+                if not overwrite:
                     try:
-                        # Check if file exists
-                        file_exists = False
-                        try:
-                            sftp.stat(remote_path)
-                            file_exists = True
-                        except:
-                            pass
-                        
-                        if file_exists and not overwrite:
-                            skipped_files += 1
-                            self.logger.log(f"Skipped {local_path} (already exists)")
-                            continue
-                        
-                        # Upload file with progress tracking
-                        sftp.put(local_path, remote_path, callback=lambda current, total, 
-                                fn=file_name, rp=remote_path, lp=local_path: 
-                                self._upload_progress(current, total, fn, rp, lp, on_progress))
-                        
-                        uploaded_files += 1
-                        self.logger.log(f"Uploaded {local_path} to {remote_path}")
-                    
+                        with self.ssh_client.borrow_sftp() as sftp:
+                            existing_names = set(sftp.listdir(remote_dir))
                     except Exception as e:
-                        failed_files += 1
-                        self.logger.log(f"Error uploading {local_path}: {str(e)}")
+                        self.logger.log(f"Could not list {remote_dir}, checking files individually: {str(e)}")
+                
+                # Upload files in parallel, each worker on its own pooled SFTP channel
+                with ThreadPoolExecutor(max_workers=self.ssh_client.sftp_pool_size) as executor:
+                    futures = [
+                        executor.submit(self._upload_file, local_path, remote_dir, overwrite, existing_names,
+                                        i, total_files, on_progress)
+                        for i, local_path in enumerate(local_files)
+                    ]
+                    
+                    for future in as_completed(futures):
+                        result = future.result()
+                        if result == 'uploaded':
+                            uploaded_files += 1
+                        elif result == 'skipped':
+                            skipped_files += 1
+                        else:
+                            failed_files += 1
                 
                 # Final status update
                 success = failed_files == 0
@@ -365,15 +501,10 @@ class SFTPOperations:
                 if self.on_status_change:
                     self.on_status_change(status_msg)
                 
-                if on_complete:
-                    on_complete(success, uploaded_files, failed_files, 
+                self._complete(on_complete, success, uploaded_files, failed_files,
                                None if success else "Some files failed to upload")
                 
                 self.logger.log(status_msg)
-                
-                # Refresh directory listing if upload successful
-                if success and uploaded_files > 0:
-                    self.list_directory(remote_dir)
             
             except Exception as e:
                 error_msg = f"Error during upload operation: {str(e)}"
@@ -382,11 +513,171 @@ class SFTPOperations:
                 if self.on_status_change:
                     self.on_status_change("Upload failed")
                 
-                if on_complete:
-                    on_complete(False, 0, 0, error_msg)
+                self._complete(on_complete, False, 0, 0, error_msg)
+        
+        # Run on the shared worker pool
+        self._executor.submit(upload_thread)
+    
+    def download_tree_fast(self, remote_dir, local_dir, on_complete=None):
+        """
+        Download a directory tree as a single tar stream over an exec channel
+        
+        The tree lands in local_dir/<name> like download_files, without
+        per-file SFTP round-trips. Members the data filter rejects, such as
+        absolute symlinks, are skipped and logged. Falls back to download_files
+        if the server has no tar or tarfile cannot filter the archive.
+        
+        Args:
+            remote_dir: Remote directory to download
+            local_dir: Local directory to save the tree in
+            on_complete: Callback function(success, error_message)
+        """
+        def download_tree_thread():
+            remote_path = remote_dir.replace('\\', '/').rstrip('/') or '/'
+            parent_dir, dir_name = posixpath.split(remote_path)
+            
+            def download_over_sftp():
+                self.download_files(
+                    [{'path': remote_path, 'name': dir_name, 'type': 'directory'}], local_dir,
+                    on_complete=lambda success, downloaded, failed, error:
+                        on_complete(success, error) if on_complete else None)
+            
+            if _TAR_DATA_FILTER is None:
+                self.logger.log("tarfile cannot filter archives on this Python, downloading over SFTP")
+                download_over_sftp()
+                return
+            
+            skipped = []
+            
+            def safe_member(member, dest_path):
+                # Skip what the data filter rejects instead of aborting the whole extraction
+                try:
+                    return _TAR_DATA_FILTER(member, dest_path)
+                except tarfile.FilterError as filter_e:
+                    skipped.append(f"{member.name} ({str(filter_e)})")
+                    return None
+            
+            try:
+                if self.on_status_change:
+                    self.on_status_change(f"Downloading {remote_path} as tar stream...")
+                
+                channel = self.ssh_client.client.get_transport().open_session()
+                try:
+                    channel.exec_command(f"tar -C {shlex.quote(parent_dir or '/')} -cf - {shlex.quote(dir_name or '.')}")
+                    
+                    try:
+                        os.makedirs(local_dir, exist_ok=True)
+                        with channel.makefile('rb') as stream, tarfile.open(fileobj=stream, mode='r|') as tar:
+                            tar.extractall(local_dir, filter=safe_member)
+                    except tarfile.ReadError:
+                        pass  # Empty stream, reported through the exit status below
+                    
+                    status = channel.recv_exit_status()
+                finally:
+                    # Also on failure, so the remote tar is not left blocked on a full window
+                    channel.close()
+                
+                if status == _COMMAND_NOT_FOUND:
+                    self.logger.log("tar not available on server, downloading over SFTP")
+                    download_over_sftp()
+                    return
+                if status != 0:
+                    raise IOError(f"tar exited with status {status}")
+                
+                for member in skipped:
+                    self.logger.log(f"Skipped unsafe archive member {member}")
+                
+                self.logger.log(f"Downloaded {remote_path} to {local_dir} as tar stream")
+                if self.on_status_change:
+                    self.on_status_change(f"Download complete: {remote_path}")
+                
+                self._complete(on_complete, True, None)
+            
+            except Exception as e:
+                error_msg = f"Error downloading {remote_path}: {str(e)}"
+                self.logger.log(error_msg)
+                
+                if self.on_status_change:
+                    self.on_status_change("Download failed")
+                
+                self._complete(on_complete, False, error_msg)
+        
+        # Run on the shared worker pool
+        self._executor.submit(download_tree_thread)
+    
+    def upload_tree_fast(self, local_dir, remote_dir, on_complete=None):
+        """
+        Upload a directory tree as a single tar stream over an exec channel
+        
+        The tree lands in remote_dir/<name>, without per-file SFTP round-trips.
+        Falls back to per-file SFTP if the server has no tar.
+        
+        Args:
+            local_dir: Local directory to upload
+            remote_dir: Remote directory to upload the tree into
+            on_complete: Callback function(success, error_message)
+        """
+        def upload_tree_thread():
+            local_path = os.path.normpath(local_dir)
+            dir_name = os.path.basename(local_path)
+            remote_parent = remote_dir.replace('\\', '/')
+            
+            try:
+                if self.on_status_change:
+                    self.on_status_change(f"Uploading {local_path} as tar stream...")
+                
+                channel = self.ssh_client.client.get_transport().open_session()
+                stream_error = None
+                try:
+                    channel.exec_command(f"mkdir -p {shlex.quote(remote_parent)} && "
+                                         f"tar -C {shlex.quote(remote_parent)} -xpf -")
+                    
+                    try:
+                        with channel.makefile('wb') as stream:
+                            with tarfile.open(fileobj=stream, mode='w|') as tar:
+                                tar.add(local_path, arcname=dir_name)
+                    except (OSError, EOFError) as stream_e:
+                        # An unreadable local file or the remote side going away
+                        stream_error = stream_e
+                    finally:
+                        # Always send EOF, the remote tar waits for it before exiting
+                        try:
+                            channel.shutdown_write()
+                        except Exception:
+                            pass
+                    
+                    status = channel.recv_exit_status()
+                finally:
+                    channel.close()
+                
+                if status == _COMMAND_NOT_FOUND:
+                    self.logger.log("tar not available on server, uploading over SFTP")
+                    failed_files = self._upload_tree_sftp(local_path, posixpath.join(remote_parent, dir_name))
+                    if failed_files:
+                        raise IOError(f"{failed_files} files failed to upload")
+                elif stream_error is not None:
+                    # The archive is cut short, so whatever the remote tar says this did not upload
+                    raise IOError(f"tar stream ended early: {str(stream_error)}")
+                elif status != 0:
+                    raise IOError(f"tar exited with status {status}")
+                
+                self.logger.log(f"Uploaded {local_path} to {remote_parent}")
+                if self.on_status_change:
+                    self.on_status_change(f"Upload complete: {local_path}")
+                
+                self._complete(on_complete, True, None)
+            
+            except Exception as e:
+                error_msg = f"Error uploading {local_path}: {str(e)}"
+                self.logger.log(error_msg)
+                
+                if self.on_status_change:
+                    self.on_status_change("Upload failed")
+                
+                self._complete(on_complete, False, error_msg)
         
-        # Run in a separate thread
-        threading.Thread(target=upload_thread, daemon=True).start()
+        # Run on the shared worker pool
+        self._executor.submit(upload_tree_thread)
     
     def create_directory(self, remote_parent_dir, new_dir_name, on_complete=None):
         """
@@ -398,10 +689,9 @@ class SFTPOperations:
             on_complete: Completion callback function
         """
         def create_dir_thread():
-            sftp = self.ssh_client.get_sftp_client()
+            sftp = self._get_sftp()
             if not sftp:
-                if on_complete:
-                    on_complete(False, "Could not establish SFTP connection")
+                self._complete(on_complete, False, "Could not establish SFTP connection")
                 return
             
             try:
@@ -410,8 +700,7 @@ class SFTPOperations:
                 # Check if directory already exists
                 try:
                     sftp.stat(remote_path)
-                    if on_complete:
-                        on_complete(False, f"Directory {new_dir_name} already exists")
+                    self._complete(on_complete, False, f"Directory {new_dir_name} already exists")
                     return
                 except:
                     pass
@@ -420,21 +709,16 @@ class SFTPOperations:
                 sftp.mkdir(remote_path)
                 self.logger.log(f"Created directory {remote_path}")
                 
-                if on_complete:
-                    on_complete(True, None)
-                
-                # Refresh directory listing
-                self.list_directory(remote_parent_dir)
+                self._complete(on_complete, True, None)
             
             except Exception as e:
                 error_msg = f"Error creating directory {new_dir_name}: {str(e)}"
                 self.logger.log(error_msg)
                 
-                if on_complete:
-                    on_complete(False, error_msg)
+                self._complete(on_complete, False, error_msg)
         
-        # Run in a separate thread
-        threading.Thread(target=create_dir_thread, daemon=True).start()
+        # Run on the shared SFTP client's thread
+        self._submit(create_dir_thread)
     
     def delete_item(self, item, on_complete=None):
         """
@@ -445,14 +729,13 @@ class SFTPOperations:
             on_complete: Completion callback function
         """
         def delete_thread():
-            sftp = self.ssh_client.get_sftp_client()
+            sftp = self._get_sftp()
             if not sftp:
-                if on_complete:
-                    on_complete(False, "Could not establish SFTP connection")
+                self._complete(on_complete, False, "Could not establish SFTP connection")
                 return
             
+            normalized_remote_path = item['path'].replace('\\', '/')
             try:
-                normalized_remote_path = item['path'].replace('\\', '/')
                 item_type = item['type']
                 
                 if item_type == 'directory':
@@ -464,22 +747,68 @@ class SFTPOperations:
                 
                 self.logger.log(f"Deleted {item_type} {normalized_remote_path}")
                 
-                if on_complete:
-                    on_complete(True, None)
-                
-                # Refresh parent directory listing
-                parent_dir = posixpath.dirname(normalized_remote_path)
-                self.list_directory(parent_dir)
+                self._complete(on_complete, True, None)
             
             except Exception as e:
-                error_msg = f"Error deleting {item['path'].replace('\\', '/')}: {str(e)}"
+                error_msg = f"Error deleting {normalized_remote_path}: {str(e)}"
                 self.logger.log(error_msg)
                 
-                if on_complete:
-                    on_complete(False, error_msg)
+                self._complete(on_complete, False, error_msg)
+        
+        # Run on the shared SFTP client's thread
+        self._submit(delete_thread)
+    
+    def delete_items(self, items, on_complete=None):
+        """
+        Delete several files and directories as one batch
+        
+        File removes are spread over the pooled channels by _remove_files,
+        so a large selection is not one round-trip per item on one channel.
+        
+        Args:
+            items: List of item dictionaries with path, name and type
+            on_complete: Callback function(deleted_count, failed) where failed
+                is a list of (name, error_message) pairs
+        """
+        def delete_items_thread():
+            sftp = self._get_sftp()
+            if not sftp:
+                self._complete(on_complete, 0,
+                               [(item['name'], "Could not establish SFTP connection") for item in items])
+                return
+            
+            deleted = 0
+            failed = []
+            files = [item for item in items if item['type'] != 'directory']
+            directories = [item for item in items if item['type'] == 'directory']
+            
+            with ThreadPoolExecutor(max_workers=self.ssh_client.sftp_pool_size) as executor:
+                names = {item['path'].replace('\\', '/'): item['name'] for item in files}
+                errors = self._remove_files(list(names), executor)
+                
+                deleted += len(names) - len(errors)
+                for path, error in errors:
+                    self.logger.log(f"Error deleting {path}: {error}")
+                    failed.append((names[path], error))
+                
+                # Directories are listed on the shared client, their files removed on pooled channels
+                for item in directories:
+                    try:
+                        self._delete_directory_recursive(sftp, item['path'].replace('\\', '/'), executor)
+                        deleted += 1
+                    except Exception as e:
+                        failed.append((item['name'], str(e)))
+            
+            status_msg = (f"Deleted {deleted} items"
+                          f"{f', {len(failed)} failed' if failed else ''}")
+            self.logger.log(status_msg)
+            if self.on_status_change:
+                self.on_status_change(status_msg)
+            
+            self._complete(on_complete, deleted, failed)
         
-        # Run in a separate thread
-        threading.Thread(target=delete_thread, daemon=True).start()
+        # Run on the shared SFTP client's thread
+        self._submit(delete_items_thread)
     
     def rename_item(self, item, new_name, on_complete=None):
         """
@@ -491,23 +820,21 @@ class SFTPOperations:
             on_complete: Completion callback function
         """
         def rename_thread():
-            sftp = self.ssh_client.get_sftp_client()
+            sftp = self._get_sftp()
             if not sftp:
-                if on_complete:
-                    on_complete(False, "Could not establish SFTP connection")
+                self._complete(on_complete, False, "Could not establish SFTP connection")
                 return
             
+            normalized_old_path = item['path'].replace('\\', '/')
             try:
-                parent_dir = posixpath.dirname(item['path'].replace('\\', '/'))
-                normalized_old_path = item['path'].replace('\\', '/')
+                parent_dir = posixpath.dirname(normalized_old_path)
                 normalized_new_path = posixpath.join(parent_dir, new_name)
                 normalized_new_path = normalized_new_path.replace('\\', '/')
                 
                 # Check if target already exists
                 try:
                     sftp.stat(normalized_new_path)
-                    if on_complete:
-                        on_complete(False, f"A file or directory named {new_name} already exists")
+                    self._complete(on_complete, False, f"A file or directory named {new_name} already exists")
                     return
                 except:
                     pass
@@ -516,21 +843,16 @@ class SFTPOperations:
                 sftp.rename(normalized_old_path, normalized_new_path)
                 self.logger.log(f"Renamed {normalized_old_path} to {normalized_new_path}")
                 
-                if on_complete:
-                    on_complete(True, None)
-                
-                # Refresh directory listing
-                self.list_directory(parent_dir)
+                self._complete(on_complete, True, None)
             
             except Exception as e:
-                error_msg = f"Error renaming {item['path'].replace('\\', '/')}: {str(e)}"
+                error_msg = f"Error renaming {normalized_old_path}: {str(e)}"
                 self.logger.log(error_msg)
                 
-                if on_complete:
-                    on_complete(False, error_msg)
+                self._complete(on_complete, False, error_msg)
         
-        # Run in a separate thread
-        threading.Thread(target=rename_thread, daemon=True).start()
+        # Run on the shared SFTP client's thread
+        self._submit(rename_thread)
     
     def get_file_content(self, remote_path, on_complete=None):
         """
@@ -542,31 +864,63 @@ class SFTPOperations:
         """
         def get_content_thread():
             normalized_remote_path = remote_path.replace('\\', '/') # Ensure forward slashes
-            sftp = self.ssh_client.get_sftp_client()
+            sftp = self._get_sftp()
             if not sftp:
-                if on_complete:
-                    on_complete(False, None, "Could not establish SFTP connection")
+                self._complete(on_complete, False, None, "Could not establish SFTP connection")
                 return
             
             try:
-                # Create a StringIO object to store file content
-                with sftp.open(normalized_remote_path, 'r') as f:
-                    content = f.read().decode('utf-8', errors='replace')
+                # Prefetch the whole file so its reads are pipelined, then read it in one go
+                with sftp.open(normalized_remote_path, 'rb', bufsize=SFTP_BUF) as f:
+                    f.prefetch(max_concurrent_requests=self.max_concurrent_requests)
+                    data = f.read()
+                content = data.decode('utf-8', errors='replace')
                 
                 self.logger.log(f"Read content from {normalized_remote_path}")
                 
-                if on_complete:
-                    on_complete(True, content, None)
+                self._complete(on_complete, True, content, None)
             
             except Exception as e:
                 error_msg = f"Error reading file {normalized_remote_path}: {str(e)}"
                 self.logger.log(error_msg)
                 
-                if on_complete:
-                    on_complete(False, None, error_msg)
+                self._complete(on_complete, False, None, error_msg)
         
-        # Run in a separate thread
-        threading.Thread(target=get_content_thread, daemon=True).start()
+        # Run on the shared SFTP client's thread
+        self._submit(get_content_thread)
+    
+    def get_file_head(self, remote_path, max_bytes, on_complete=None):
+        """
+        Get at most the first max_bytes of a text file, for previews
+        
+        Args:
+            remote_path: Path to the remote file
+            max_bytes: Number of bytes to read from the start of the file
+            on_complete: Callback function(success, content, error_message)
+        """
+        def get_head_thread():
+            normalized_remote_path = remote_path.replace('\\', '/') # Ensure forward slashes
+            sftp = self._get_sftp()
+            if not sftp:
+                self._complete(on_complete, False, None, "Could not establish SFTP connection")
+                return
+            
+            try:
+                # No prefetch, only the requested range is read however large the file is
+                with sftp.open(normalized_remote_path, 'rb', bufsize=SFTP_BUF) as f:
+                    data = f.read(max_bytes)
+                content = data.decode('utf-8', errors='replace')
+                
+                self._complete(on_complete, True, content, None)
+            
+            except Exception as e:
+                error_msg = f"Error reading file {normalized_remote_path}: {str(e)}"
+                self.logger.log(error_msg)
+                
+                self._complete(on_complete, False, None, error_msg)
+        
+        # Run on the shared SFTP client's thread
+        self._submit(get_head_thread)
     
     def save_file_content(self, remote_path, content, on_complete=None):
         """
@@ -579,108 +933,488 @@ class SFTPOperations:
         """
         def save_content_thread():
             normalized_remote_path = remote_path.replace('\\', '/') # Ensure forward slashes
-            sftp = self.ssh_client.get_sftp_client()
+            sftp = self._get_sftp()
             if not sftp:
-                if on_complete:
-                    on_complete(False, "Could not establish SFTP connection")
+                self._complete(on_complete, False, "Could not establish SFTP connection")
                 return
             
             try:
-                # Write content to file
-                with sftp.open(normalized_remote_path, 'wb') as f:
+                # Write content to file, without waiting for each write to be acknowledged
+                with sftp.open(normalized_remote_path, 'wb', bufsize=SFTP_BUF) as f:
+                    f.set_pipelined(True)
                     f.write(content.encode('utf-8'))
                 
                 self.logger.log(f"Saved content to {normalized_remote_path}")
                 
-                if on_complete:
-                    on_complete(True, None)
+                self._complete(on_complete, True, None)
             
             except Exception as e:
                 error_msg = f"Error saving file {normalized_remote_path}: {str(e)}"
                 self.logger.log(error_msg)
                 
-                if on_complete:
-                    on_complete(False, error_msg)
+                self._complete(on_complete, False, error_msg)
+        
+        # Run on the shared SFTP client's thread
+        self._submit(save_content_thread)
+    
+    def start_progress_pump(self, root):
+        """
+        Deliver transfer progress on the Tk main thread at about 30 Hz
+        
+        Args:
+            root: Tk root window used to schedule the drain loop
+        """
+        self._progress_root = root
+        root.after(33, self._drain_progress)
+    
+    def close(self):
+        """Stop the worker pools, dropping operations that have not started yet"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._sftp_executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _submit(self, task):
+        """Run task after the other shared SFTP client tasks, on the client's own thread"""
+        self._sftp_executor.submit(task)
+    
+    def _get_sftp(self):
+        """Get the shared SFTP client, only to be used by tasks started with _submit"""
+        return self.ssh_client.get_sftp_client()
+    
+    def _download_file(self, file_info, index, total, on_progress):
+        """
+        Download a single file on a pooled SFTP channel, with retry
+        
+        Args:
+            file_info: Entry from files_to_download
+            index: Position of the file in the download list
+            total: Number of files in the download list
+            on_progress: Progress callback function
+        
+        Returns:
+            str: 'downloaded', 'skipped' (local copy unchanged) or 'failed'
+        """
+        # Fix Windows paths - normalize separators
+        local_path = os.path.normpath(file_info['local_path'])
+        remote_path = file_info['remote_path'].replace('\\', '/') # Ensure remote_path uses forward slashes
+        file_name = file_info['name']
+        file_size = file_info.get('size')
+        mtime = file_info.get('mtime')
+        
+        if self.on_status_change:
+            self.on_status_change(f"Downloading {file_name} ({index+1}/{total})...")
+        
+        # Skip files whose local copy has the same size and modification time
+        if file_size is not None and mtime is not None:
+            try:
+                local_stat = os.stat(local_path)
+                if local_stat.st_size == file_size and int(local_stat.st_mtime) == int(mtime):
+                    self.logger.log(f"SFTP: Skipped {remote_path} (unchanged)")
+                    return 'skipped'
+            except OSError:
+                pass
+        
+        try:
+            # Download with retry (parent directories were created by download_files)
+            retry_count = 0
+            max_file_retries = 2
+            
+            while True:
+                try:
+                    self.logger.log(f"SFTP: Attempting download of {remote_path} to {local_path}, attempt {retry_count+1}")
+                    # Channels are validated on borrow, so a retry gets a working one
+                    with self.ssh_client.borrow_sftp() as sftp:
+                        if not sftp:
+                            raise IOError("Could not borrow SFTP channel")
+                        progress = self._throttle_progress(lambda current, total, 
+                                fn=file_name, rp=remote_path, lp=local_path: 
+                                self._download_progress(current, total, fn, rp, lp, on_progress))
+                        
+                        # No existence probe, opening a missing file fails cleanly
+                        if file_size is not None and file_size > self.parallel_get_threshold:
+                            self._parallel_get(sftp, remote_path, local_path, file_size, progress)
+                        else:
+                            self._fast_get(sftp, remote_path, local_path, file_size, progress)
+                    
+                    # Stamp the remote mtime so an unchanged file is skipped next time
+                    if mtime is not None:
+                        try:
+                            os.utime(local_path, (mtime, mtime))
+                        except OSError as utime_e:
+                            self.logger.log(f"SFTP: Could not set modification time on {local_path}: {str(utime_e)}")
+                    
+                    self.logger.log(f"SFTP: Downloaded {remote_path} to {local_path}")
+                    return 'downloaded'
+                except Exception as dl_e:
+                    retry_count += 1
+                    file_size = None  # The listed size may be stale, stat on retry
+                    self.logger.log(f"SFTP: Download attempt {retry_count} failed for {remote_path} to {local_path}: {str(dl_e)}")
+                    if retry_count > max_file_retries:
+                        raise  # Re-raise to be caught by outer exception handler
+                    time.sleep(1)  # Brief pause before retry
+        
+        except Exception as e:
+            self.logger.log(f"SFTP: Error downloading remote file '{remote_path}' to local file '{local_path}': {str(e)}")
+            return 'failed'
+    
+    def _fast_get(self, sftp, remote_path, local_path, file_size=None, callback=None):
+        """
+        Download a file with pipelined reads
+        
+        Unlike sftp.get, the whole file is prefetched so many read requests are
+        in flight at once, and the local file is written in 1 MB chunks.
+        
+        Args:
+            sftp: SFTP client
+            remote_path: Remote file path
+            local_path: Local file path
+            file_size: Remote size if already known from a listing, else it is stat'ed
+            callback: Called with (transferred, total) after each chunk
+        """
+        with sftp.open(remote_path, 'rb', bufsize=SFTP_BUF) as remote_file:
+            if file_size is None:
+                file_size = remote_file.stat().st_size
+            remote_file.prefetch(file_size, max_concurrent_requests=self.max_concurrent_requests)
+            
+            transferred = 0
+            with open(local_path, 'wb', buffering=1 << 20) as local_file:
+                while True:
+                    chunk = remote_file.read(1 << 20)
+                    if not chunk:
+                        break
+                    local_file.write(chunk)
+                    transferred += len(chunk)
+                    if callback:
+                        callback(transferred, file_size)
+        
+        if transferred != file_size:
+            raise IOError(f"Size mismatch downloading {remote_path}: {transferred} != {file_size}")
+    
+    def _upload_tree_sftp(self, local_dir, remote_dir):
+        """
+        Upload a directory tree file by file, the fallback for upload_tree_fast
+        
+        Args:
+            local_dir: Local directory to upload
+            remote_dir: Remote directory that will mirror local_dir
+        
+        Returns:
+            int: Number of files that failed to upload
+        """
+        failed_files = 0
+        with self.ssh_client.borrow_sftp() as sftp:
+            if not sftp:
+                raise IOError("Could not borrow SFTP channel")
+            
+            for dir_path, _, file_names in os.walk(local_dir):
+                rel_path = os.path.relpath(dir_path, local_dir)
+                remote_path = remote_dir if rel_path == '.' else posixpath.join(remote_dir, rel_path.replace(os.sep, '/'))
+                
+                try:
+                    sftp.mkdir(remote_path)
+                except IOError:
+                    pass  # Already exists
+                
+                for file_name in file_names:
+                    try:
+                        self._fast_put(sftp, os.path.join(dir_path, file_name), posixpath.join(remote_path, file_name))
+                    except Exception as e:
+                        failed_files += 1
+                        self.logger.log(f"Error uploading {os.path.join(dir_path, file_name)}: {str(e)}")
+        
+        return failed_files
+    
+    def _upload_file(self, local_path, remote_dir, overwrite, existing_names, index, total, on_progress):
+        """
+        Upload a single file on a pooled SFTP channel
+        
+        Args:
+            local_path: Local file path
+            remote_dir: Remote directory to upload to
+            overwrite: Whether to overwrite an existing file
+            existing_names: Set of names already in remote_dir, or None to stat the file
+            index: Position of the file in the upload list
+            total: Number of files in the upload list
+            on_progress: Progress callback function
+        
+        Returns:
+            str: 'uploaded', 'skipped' or 'failed'
+        """
+        file_name = os.path.basename(local_path)
+        remote_path = posixpath.join(remote_dir, file_name)
+        
+        if self.on_status_change:
+            self.on_status_change(f"Uploading {file_name} ({index+1}/{total})...")
+        
+        if not overwrite and existing_names is not None and file_name in existing_names:
+            self.logger.log(f"Skipped {local_path} (already exists)")
+            return 'skipped'
+        
+        try:
+            with self.ssh_client.borrow_sftp() as sftp:
+                if not sftp:
+                    raise IOError("Could not borrow SFTP channel")
+                
+                # Check if file exists, only when the directory listing was unavailable
+                if not overwrite and existing_names is None:
+                    file_exists = False
+                    try:
+                        sftp.stat(remote_path)
+                        file_exists = True
+                    except:
+                        pass
+                    
+                    if file_exists:
+                        self.logger.log(f"Skipped {local_path} (already exists)")
+                        return 'skipped'
+                
+                # Upload file with progress tracking
+                self._fast_put(sftp, local_path, remote_path, callback=self._throttle_progress(lambda current, total, 
+                        fn=file_name, rp=remote_path, lp=local_path: 
+                        self._upload_progress(current, total, fn, rp, lp, on_progress)))
+            
+            self.logger.log(f"Uploaded {local_path} to {remote_path}")
+            return 'uploaded'
         
-        # Run in a separate thread
-        threading.Thread(target=save_content_thread, daemon=True).start()
+        except Exception as e:
+            self.logger.log(f"Error uploading {local_path}: {str(e)}")
+            return 'failed'
     
-    def _count_dir_files(self, sftp, remote_dir, files_list, dirs_list, local_base_dir, rel_path):
+    def _parallel_get(self, sftp, remote_path, local_path, file_size, callback=None):
         """
-        Recursively count files in a directory for download
+        Download a large file as byte ranges fetched concurrently
+        
+        The given channel carries one stream and extra channels are opened for
+        the rest, using fewer streams if the server refuses more sessions. Each
+        stream writes its ranges in place into a preallocated local file.
+        
+        Args:
+            sftp: SFTP client
+            remote_path: Remote file path
+            local_path: Local file path
+            file_size: Remote file size
+            callback: Called with (transferred, total) after each chunk
+        """
+        chunk_size = 1 << 20
+        extra_channels = []
+        for _ in range(self.parallel_get_streams - 1):
+            try:
+                channel = self.ssh_client.client.open_sftp()
+                channel.sock.settimeout(30)  # 30 second timeout for operations
+                extra_channels.append(channel)
+            except Exception as e:
+                self.logger.log(f"SFTP: Could not open extra channel for {remote_path}: {str(e)}")
+                break
+        
+        channels = queue.Queue()
+        for channel in [sftp] + extra_channels:
+            channels.put(channel)
+        stream_count = channels.qsize()
+        
+        # Preallocate so every stream can write its range in place
+        with open(local_path, 'wb') as local_file:
+            local_file.truncate(file_size)
+        
+        range_size = -(-file_size // self.parallel_get_streams)
+        progress_lock = threading.Lock()
+        transferred = 0
+        
+        def fetch_range(start, length):
+            nonlocal transferred
+            channel = channels.get()
+            try:
+                with channel.open(remote_path, 'rb', bufsize=SFTP_BUF) as remote_file, \
+                        open(local_path, 'r+b', buffering=1 << 20) as local_file:
+                    local_file.seek(start)
+                    end = start + length
+                    # readv keeps the reads for the whole range in flight
+                    chunks = [(offset, min(chunk_size, end - offset)) for offset in range(start, end, chunk_size)]
+                    for data in remote_file.readv(chunks, max_concurrent_prefetch_requests=self.max_concurrent_requests):
+                        local_file.write(data)
+                        with progress_lock:
+                            transferred += len(data)
+                            if callback:
+                                callback(transferred, file_size)
+            finally:
+                channels.put(channel)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=stream_count) as executor:
+                futures = [
+                    executor.submit(fetch_range, start, min(range_size, file_size - start))
+                    for start in range(0, file_size, range_size)
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            for channel in extra_channels:
+                try:
+                    channel.close()
+                except Exception:
+                    pass
+        
+        if transferred != file_size:
+            raise IOError(f"Size mismatch downloading {remote_path}: {transferred} != {file_size}")
+    
+    def _fast_put(self, sftp, local_path, remote_path, callback=None):
+        """
+        Upload a file with pipelined writes
+        
+        Write requests are sent without waiting for each acknowledgement, in
+        1 MB chunks read through a 1 MB local buffer. Errors from any write
+        surface when the remote file is closed.
         
         Args:
             sftp: SFTP client
+            local_path: Local file path
+            remote_path: Remote file path
+            callback: Called with (transferred, total) after each chunk
+        """
+        with open(local_path, 'rb', buffering=1 << 20) as local_file:
+            file_size = os.fstat(local_file.fileno()).st_size
+            
+            transferred = 0
+            with sftp.open(remote_path, 'wb', bufsize=SFTP_BUF) as remote_file:
+                remote_file.set_pipelined(True)
+                while True:
+                    chunk = local_file.read(1 << 20)
+                    if not chunk:
+                        break
+                    remote_file.write(chunk)
+                    transferred += len(chunk)
+                    if callback:
+                        callback(transferred, file_size)
+    
+    def _count_dir_files(self, remote_dir, files_list, dirs_list, local_base_dir, rel_path):
+        """
+        Walk a remote directory tree and collect its files for download
+        
+        Directories are listed concurrently, each on a pooled SFTP channel, and
+        every finished listing queues its subdirectories.
+        
+        Args:
             remote_dir: Remote directory path
             files_list: List to add files to
             dirs_list: List to add directories to
             local_base_dir: Base local directory
             rel_path: Relative path from base directory (uses POSIX separators initially)
         """
+        with ThreadPoolExecutor(max_workers=self.ssh_client.sftp_pool_size) as executor:
+            pending = {executor.submit(self._scan_download_dir, remote_dir, local_base_dir, rel_path)}
+            
+            # Results are merged on this thread only, so the lists need no lock
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    local_dir_path, files, subdirs = future.result()
+                    dirs_list.append(local_dir_path)
+                    files_list.extend(files)
+                    for sub_remote_dir, sub_rel_path in subdirs:
+                        pending.add(executor.submit(self._scan_download_dir, sub_remote_dir,
+                                                    local_base_dir, sub_rel_path))
+    
+    def _scan_download_dir(self, remote_dir, local_base_dir, rel_path):
+        """
+        List one remote directory for _count_dir_files
+        
+        Args:
+            remote_dir: Remote directory path
+            local_base_dir: Base local directory
+            rel_path: Relative path from base directory (uses POSIX separators initially)
+        
+        Returns:
+            tuple: (local_dir_path, files, subdirs) where subdirs holds (remote_path, rel_path) pairs
+        """
         self.logger.log(f"SFTP _count_dir_files: ENTER remote_dir='{remote_dir}', local_base_dir='{local_base_dir}', rel_path='{rel_path}'")
         remote_dir = remote_dir.replace('\\', '/') # Ensure remote_dir uses forward slashes
+        
+        # Convert all paths to use correct OS-specific separators
+        clean_rel_path = rel_path.replace('/', os.sep)
+        local_dir_path = os.path.normpath(os.path.join(local_base_dir, clean_rel_path))
+        files = []
+        subdirs = []
+        
         try:
-            # Convert all paths to use correct OS-specific separators
-            clean_rel_path = rel_path.replace('/', os.sep)
-            local_dir_path = os.path.normpath(os.path.join(local_base_dir, clean_rel_path))
-            dirs_list.append(local_dir_path)
-            
             # List files in directory
-            dir_items = sftp.listdir_attr(remote_dir)
+            with self.ssh_client.borrow_sftp() as sftp:
+                if not sftp:
+                    raise IOError("Could not borrow SFTP channel")
+                dir_items = sftp.listdir_attr(remote_dir)
             self.logger.log(f"SFTP _count_dir_files: Found {len(dir_items)} items in '{remote_dir}'")
             
+            # Plain concatenation instead of posixpath.join per entry
+            remote_prefix = remote_dir.rstrip('/') + '/'
+            rel_prefix = rel_path.rstrip('/') + '/' if rel_path else ''
+            
             for item in dir_items:
                 self.logger.log(f"SFTP _count_dir_files: Processing item '{item.filename}' in '{remote_dir}'. Mode: {item.st_mode}")
                 # Build remote path with forward slashes (Unix style)
-                remote_path = posixpath.join(remote_dir, item.filename)
+                remote_path = remote_prefix + item.filename
                 
                 # Build relative path (Unix style first)
-                unix_item_rel_path = posixpath.join(rel_path, item.filename)
+                unix_item_rel_path = rel_prefix + item.filename
                 
                 # Convert to OS-specific path for local use
                 clean_item_rel_path = unix_item_rel_path.replace('/', os.sep)
                 local_path = os.path.normpath(os.path.join(local_base_dir, clean_item_rel_path))
                 
                 if stat.S_ISDIR(item.st_mode):
-                    # Recursively process subdirectory (pass Unix-style relative path)
-                    self.logger.log(f"SFTP _count_dir_files: Item '{item.filename}' is a DIRECTORY. Recursing with remote_item_path='{remote_path}', new rel_path='{unix_item_rel_path}'")
-                    self._count_dir_files(sftp, remote_path, files_list, dirs_list, 
-                                         local_base_dir, unix_item_rel_path)
+                    # Queue subdirectory (pass Unix-style relative path)
+                    self.logger.log(f"SFTP _count_dir_files: Item '{item.filename}' is a DIRECTORY. Queueing remote_item_path='{remote_path}', new rel_path='{unix_item_rel_path}'")
+                    subdirs.append((remote_path, unix_item_rel_path))
                 else:
                     # Add file to download list
-                    files_list.append({
+                    files.append({
                         'remote_path': remote_path,
                         'local_path': local_path,  # This is now OS-specific
-                        'name': unix_item_rel_path  # Used for progress display, POSIX style is fine here
+                        'name': unix_item_rel_path,  # Used for progress display, POSIX style is fine here
+                        'size': None if stat.S_ISLNK(item.st_mode) else item.st_size,
+                        'mtime': item.st_mtime
                     })
                     self.logger.log(f"SFTP _count_dir_files: Item '{item.filename}' is a FILE. Added to files_list. Remote='{remote_path}', Local='{local_path}', NameForProgress='{unix_item_rel_path}'")
         
         except Exception as e:
             self.logger.log(f"Error processing directory {remote_dir}: {str(e)}")
+        
+        return local_dir_path, files, subdirs
     
-    def _delete_directory_recursive(self, sftp, remote_dir):
+    def _delete_directory_recursive(self, sftp, remote_dir, executor=None):
         """
         Recursively delete a directory and its contents
         
+        Directories are listed on sftp, the files in each are removed by
+        _remove_files on pooled channels.
+        
         Args:
             sftp: SFTP client
             remote_dir: Remote directory path
+            executor: Pool for the removes, created on the top-level call
         """
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=self.ssh_client.sftp_pool_size) as executor:
+                return self._delete_directory_recursive(sftp, remote_dir, executor)
+        
         try:
-            # List items in directory
-            dir_items = sftp.listdir(remote_dir)
-            
-            for item_name in dir_items:
-                item_path = posixpath.join(remote_dir, item_name)
+            # List items with attributes so no per-item stat is needed. listdir_iter keeps
+            # several READDIR requests in flight
+            subdirs = []
+            file_paths = []
+            for item in sftp.listdir_iter(remote_dir):
+                item_path = posixpath.join(remote_dir, item.filename)
                 
+                # Check if it's a directory
+                if stat.S_ISDIR(item.st_mode):
+                    subdirs.append(item_path)
+                else:
+                    file_paths.append(item_path)
+            
+            # Delete files
+            for item_path, error in self._remove_files(file_paths, executor):
+                self.logger.log(f"Error deleting {item_path}: {error}")
+            
+            # Recurse on this thread so pool workers never wait on each other
+            for item_path in subdirs:
                 try:
-                    # Check if it's a directory
-                    if stat.S_ISDIR(sftp.stat(item_path).st_mode):
-                        # Recursively delete subdirectory
-                        self._delete_directory_recursive(sftp, item_path)
-                    else:
-                        # Delete file
-                        sftp.remove(item_path)
+                    self._delete_directory_recursive(sftp, item_path, executor)
                 except Exception as e:
                     self.logger.log(f"Error deleting {item_path}: {str(e)}")
             
@@ -691,54 +1425,131 @@ class SFTPOperations:
             self.logger.log(f"Error deleting directory {remote_dir}: {str(e)}")
             raise
     
-    def _format_permissions(self, mode):
-        """Format file permissions as a string (like ls -l)"""
-        perms = ['---', '--x', '-w-', '-wx', 'r--', 'r-x', 'rw-', 'rwx']
-        perm_str = ''
+    def _remove_files(self, paths, executor):
+        """
+        Remove files over pooled SFTP channels
         
-        # File type
-        if stat.S_ISDIR(mode):
-            perm_str += 'd'
-        elif stat.S_ISLNK(mode):
-            perm_str += 'l'
-        else:
-            perm_str += '-'
+        SFTPClient is not thread-safe, so each worker removes its share of
+        the paths one after another on a channel of its own.
+        
+        Args:
+            paths: Remote file paths
+            executor: Pool to run the workers on
         
-        # User permissions
-        perm_str += perms[(mode >> 6) & 0o7]
-        # Group permissions
-        perm_str += perms[(mode >> 3) & 0o7]
-        # Other permissions
-        perm_str += perms[mode & 0o7]
+        Returns:
+            list: (path, error_message) for each file that could not be removed
+        """
+        workers = self.ssh_client.sftp_pool_size
+        shares = [paths[i::workers] for i in range(min(workers, len(paths)))]
         
-        return perm_str
+        # Results are merged on this thread only, so the list needs no lock
+        failed = []
+        for future in as_completed([executor.submit(self._remove_share, share) for share in shares]):
+            failed.extend(future.result())
+        return failed
     
-    def _download_progress(self, transferred, total, filename, remote_path, local_path, callback=None):
-        """Handle download progress updates"""
+    def _remove_share(self, paths):
+        """Remove paths in turn on one borrowed SFTP channel, returning the failures"""
+        failed = []
+        with self.ssh_client.borrow_sftp() as sftp:
+            for path in paths:
+                try:
+                    if not sftp:
+                        raise IOError("Could not borrow SFTP channel")
+                    sftp.remove(path)
+                except Exception as e:
+                    failed.append((path, str(e)))
+        return failed
+    
+    def _throttle_progress(self, report, interval=0.1, min_bytes=4 * 1024 * 1024):
+        """
+        Wrap a (transferred, total) progress callback to limit how often it fires
+        
+        Updates pass through once interval seconds or min_bytes have gone by
+        since the last one, and completion is always reported.
+        """
+        last_time = 0.0
+        last_bytes = 0
+        
+        def throttled(transferred, total):
+            nonlocal last_time, last_bytes
+            now = time.monotonic()
+            if (transferred < total and now - last_time < interval
+                    and transferred - last_bytes < min_bytes):
+                return
+            last_time = now
+            last_bytes = transferred
+            report(transferred, total)
+        
+        return throttled
+    
+    def _report_progress(self, action, filename, transferred, total, callback):
+        """Queue a progress event for the Tk thread, or deliver it directly if no pump is running"""
+        if self._progress_root is not None:
+            # Raw values only, formatting is left to the drain for the events it actually shows
+            self._progress_q.put((action, filename, transferred, total, callback))
+            return
+        
+        self._deliver_progress(action, filename, transferred, total, callback)
+    
+    def _deliver_progress(self, action, filename, transferred, total, callback):
+        """Format a progress event and pass it to the status bar and callback"""
         if total == 0:  # Avoid division by zero
             percent = 100
         else:
             percent = (transferred / total) * 100
         
-        status_msg = f"Downloading {filename}: {transferred}/{total} bytes ({percent:.1f}%)"
-        
         if self.on_status_change:
-            self.on_status_change(status_msg)
+            self.on_status_change(f"{action} {filename}: {transferred}/{total} bytes ({percent:.1f}%)")
         
         if callback:
             callback(filename, transferred, total, percent)
     
-    def _upload_progress(self, transferred, total, filename, remote_path, local_path, callback=None):
-        """Handle upload progress updates"""
-        if total == 0:  # Avoid division by zero
-            percent = 100
-        else:
-            percent = (transferred / total) * 100
+    def _complete(self, on_complete, *args):
+        """Queue a completion callback for the Tk thread, or call it directly if no pump is running"""
+        if not on_complete:
+            return
         
-        status_msg = f"Uploading {filename}: {transferred}/{total} bytes ({percent:.1f}%)"
+        if self._progress_root is not None:
+            self._complete_q.put((on_complete, args))
+            return
         
-        if self.on_status_change:
-            self.on_status_change(status_msg)
+        on_complete(*args)
+    
+    def _drain_progress(self):
+        """Deliver queued progress, latest per file, then queued completions on the Tk thread"""
+        latest = {}
+        try:
+            for _ in range(1000):
+                event = self._progress_q.get_nowait()
+                latest.pop(event[1], None)  # Re-insert so the most recent file is reported last
+                latest[event[1]] = event
+        except queue.Empty:
+            pass
         
-        if callback:
-            callback(filename, transferred, total, percent)
\ No newline at end of file
+        for event in latest.values():
+            try:
+                self._deliver_progress(*event)
+            except Exception as e:
+                self.logger.log(f"Error delivering progress for {event[1]}: {str(e)}")
+        
+        # Completions last, so a transfer's final progress is shown before it closes
+        try:
+            while True:
+                on_complete, args = self._complete_q.get_nowait()
+                try:
+                    on_complete(*args)
+                except Exception as e:
+                    self.logger.log(f"Error in completion callback: {str(e)}")
+        except queue.Empty:
+            pass
+        
+        self._progress_root.after(33, self._drain_progress)
+    
+    def _download_progress(self, transferred, total, filename, remote_path, local_path, callback=None):
+        """Handle download progress updates"""
+        self._report_progress("Downloading", filename, transferred, total, callback)
+    
+    def _upload_progress(self, transferred, total, filename, remote_path, local_path, callback=None):
+        """Handle upload progress updates"""
+        self._report_progress("Uploading", filename, transferred, total, callback)
\ No newline at end of file
@@ -16,6 +16,123 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import json
 import os
+import re
+
+# Cheat sheet contents shown in the dialog tabs and written by the export,
+# as (tab, ((section, (command, ...)), ...)) pairs shared by every dialog
+_CHEATSHEET_CATEGORIES = (
+    ("Server Connection", (
+        ("Connect to Servers", (
+            "ssh root@149.28.126.226      # VULTR",
+            "ssh -v forgeadmin@209.145.57.9"
+        )),
+        ("Basic Tips", (
+            "`Tab` key → auto-completes filenames/directories.",
+            "`Ctrl+C` → cancel current running command.",
+            "`Ctrl+X` → exit Nano editor.",
+            "`Ctrl+O` → save file in Nano.",
+            "`Up Arrow` → show your last command again."
+        )),
+    )),
+    ("Application Commands", (
+        ("Virtual Environment", (
+            "source /var/www/myforge.ai/venv/bin/activate",
+        )),
+        ("Launch Applications", (
+            "uvicorn server:app --host 0.0.0.0 --port=8080 --reload",
+            "cd /var/www/myforge.ai/llama.cpp/build/bin",
+            "./llama-server -m ../../models/openchat-3.5-0106.Q4_K_M.gguf --port 8001 --threads 6"
+        )),
+        ("Control Applications", (
+            "sudo systemctl reload nginx",
+            "pkill -f uvicorn"
+        )),
+    )),
+    ("Navigation & Files", (
+        ("Navigate Folders", (
+            "cd /path/to/folder         # Change directory",
+            "cd /var/www/myforge.ai      # (Your website files)",
+            "cd /etc/nginx/sites-available  # (Nginx config files)",
+            "cd ~                        # Go back to home directory"
+        )),
+        ("List Files", (
+            "ls                         # List files",
+            "ls -l                      # Detailed list (permissions, size, date)"
+        )),
+        ("Create / Edit Files", (
+            "nano filename.ext          # Open/create file in Nano editor",
+            "nano index.html            # Edit index.html"
+        )),
+        ("Delete Files", (
+            "rm filename.ext            # Delete file",
+            "rm index.html              # Delete old index.html"
+        )),
+        ("Upload Files", (
+            "scp \"C:\\path\\to\\file.ext\" root@149.28.126.226:/path/on/server/",
+            "scp \"C:\\1bible\\mod\\new_index.html\" root@149.28.126.226:/var/www/myforge.ai/index.html"
+        )),
+    )),
+    ("Services & Processes", (
+        ("Nginx Management", (
+            "systemctl reload nginx      # Reload Nginx after config changes",
+            "systemctl restart nginx     # Full Nginx restart",
+            "systemctl status nginx      # See if Nginx is running",
+            "nginx -t                    # Test Nginx configuration"
+        )),
+        ("Background Processes", (
+            "nohup python3 server.py --port 42181 &",
+            "nohup python3 yourscript.py &",
+            "# `nohup` makes it survive even if you close the SSH session.",
+            "# `&` runs it in the background."
+        )),
+        ("Process Management", (
+            "ps aux | grep python        # View running Python processes",
+            "kill PID                    # Kill a process (replace PID with process ID)"
+        )),
+        ("Health Check", (
+            "curl http://localhost:42181/health  # Check if local API is healthy",
+        )),
+    )),
+)
+
+# Trailing shell comment, stripped before a command is copied or run
+_CMD_STRIP = re.compile(r'\s*#.*$')
+
+# Comments and key tips are shown without a Run button
+_NONRUN_PREFIXES = ('#', '`')
+_RUNNABLE_COMMANDS = frozenset(
+    command
+    for _, sections in _CHEATSHEET_CATEGORIES
+    for _, commands in sections
+    for command in commands
+    if not command.lstrip().startswith(_NONRUN_PREFIXES)
+)
+
+def _build_markdown(categories):
+    """Render cheat sheet categories as markdown, one fenced block per section"""
+    parts = ["# 🛠 Common Server Commands (Cheat Sheet)\n\n"]
+    for _, sections in categories:
+        for section_title, commands in sections:
+            parts.append(f"## 🔹 {section_title}\n```bash\n")
+            parts.extend(f"{cmd}\n" for cmd in commands)
+            parts.append("```\n\n")
+    return "".join(parts)
+
+# Exported cheat sheet, rendered once since the table never changes
+_CHEATSHEET_MARKDOWN = _build_markdown(_CHEATSHEET_CATEGORIES)
+
+# ttk.Style per theme manager, with the cheat sheet button style configured on first use
+_STYLE_CACHE = {}
+
+def _cheat_sheet_style(theme_manager):
+    """Get the shared style for cheat sheet buttons, configuring it once per theme manager"""
+    style = _STYLE_CACHE.get(id(theme_manager))
+    if style is None:
+        style = ttk.Style()
+        # Compact so the buttons fit a text line, colours are inherited from the theme's TButton
+        style.configure("Cheat.TButton", padding=(4, 0))
+        _STYLE_CACHE[id(theme_manager)] = style
+    return style
 
 class CheatSheetDialog:
     """Dialog showing SSH command cheat sheet"""
@@ -38,157 +155,26 @@ class CheatSheetDialog:
         # Center dialog
         self._center_window()
         
+        # Button style shared by every cheat sheet dialog
+        _cheat_sheet_style(theme_manager)
+        
         # Setup UI
         self._setup_ui()
     
     def _setup_ui(self):
         """Set up dialog UI"""
-        notebook = ttk.Notebook(self.dialog)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Define categories
-        categories = {
-            "Server Connection": [
-                ("Connect to Servers", [
-                    "ssh root@149.28.126.226      # VULTR",
-                    "ssh -v forgeadmin@209.145.57.9"
-                ]),
-                ("Basic Tips", [
-                    "`Tab` key → auto-completes filenames/directories.",
-                    "`Ctrl+C` → cancel current running command.",
-                    "`Ctrl+X` → exit Nano editor.",
-                    "`Ctrl+O` → save file in Nano.",
-                    "`Up Arrow` → show your last command again."
-                ])
-            ],
-            "Application Commands": [
-                ("Virtual Environment", [
-                    "source /var/www/myforge.ai/venv/bin/activate"
-                ]),
-                ("Launch Applications", [
-                    "uvicorn server:app --host 0.0.0.0 --port=8080 --reload",
-                    "cd /var/www/myforge.ai/llama.cpp/build/bin",
-                    "./llama-server -m ../../models/openchat-3.5-0106.Q4_K_M.gguf --port 8001 --threads 6"
-                ]),
-                ("Control Applications", [
-                    "sudo systemctl reload nginx",
-                    "pkill -f uvicorn"
-                ])
-            ],
-            "Navigation & Files": [
-                ("Navigate Folders", [
-                    "cd /path/to/folder         # Change directory",
-                    "cd /var/www/myforge.ai      # (Your website files)",
-                    "cd /etc/nginx/sites-available  # (Nginx config files)",
-                    "cd ~                        # Go back to home directory"
-                ]),
-                ("List Files", [
-                    "ls                         # List files",
-                    "ls -l                      # Detailed list (permissions, size, date)"
-                ]),
-                ("Create / Edit Files", [
-                    "nano filename.ext          # Open/create file in Nano editor",
-                    "nano index.html            # Edit index.html"
-                ]),
-                ("Delete Files", [
-                    "rm filename.ext            # Delete file",
-                    "rm index.html              # Delete old index.html"
-                ]),
-                ("Upload Files", [
-                    "scp \"C:\\path\\to\\file.ext\" root@149.28.126.226:/path/on/server/",
-                    "scp \"C:\\1bible\\mod\\new_index.html\" root@149.28.126.226:/var/www/myforge.ai/index.html"
-                ])
-            ],
-            "Services & Processes": [
-                ("Nginx Management", [
-                    "systemctl reload nginx      # Reload Nginx after config changes",
-                    "systemctl restart nginx     # Full Nginx restart",
-                    "systemctl status nginx      # See if Nginx is running",
-                    "nginx -t                    # Test Nginx configuration"
-                ]),
-                ("Background Processes", [
-                    "nohup python3 server.py --port 42181 &",
-                    "nohup python3 yourscript.py &",
-                    "# `nohup` makes it survive even if you close the SSH session.",
-                    "# `&` runs it in the background."
-                ]),
-                ("Process Management", [
-                    "ps aux | grep python        # View running Python processes",
-                    "kill PID                    # Kill a process (replace PID with process ID)"
-                ]),
-                ("Health Check", [
-                    "curl http://localhost:42181/health  # Check if local API is healthy"
-                ])
-            ]
-        }
-        
-        # Create tabs for each category
-        for category, sections in categories.items():
-            tab = tk.Frame(notebook, bg=self.theme_manager.bg_color, padx=10, pady=10)
-            notebook.add(tab, text=category)
-            
-            # Add scrollable canvas
-            canvas = tk.Canvas(tab, bg=self.theme_manager.bg_color, highlightthickness=0)
-            scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
-            
-            scrollable_frame = tk.Frame(canvas, bg=self.theme_manager.bg_color)
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e, canvas=canvas: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            
-            # Add sections
-            row = 0
-            for section_title, commands in sections:
-                section_label = tk.Label(
-                    scrollable_frame, text=section_title,
-                    font=("Arial", 12, "bold"),
-                    bg=self.theme_manager.bg_color, fg=self.theme_manager.accent_color,
-                    anchor=tk.W
-                )
-                section_label.grid(row=row, column=0, sticky=tk.W, pady=(10, 5))
-                row += 1
-                
-                # Add commands
-                for command in commands:
-                    cmd_frame = tk.Frame(scrollable_frame, bg=self.theme_manager.bg_color)
-                    cmd_frame.grid(row=row, column=0, sticky=tk.W+tk.E, pady=2)
-                    
-                    cmd_text = tk.Label(
-                        cmd_frame, text=command,
-                        font=("Consolas", 10),
-                        bg="#2d2d2d", fg="#aaffaa",
-                        anchor=tk.W, padx=5, pady=3,
-                        wraplength=600, justify=tk.LEFT
-                    )
-                    cmd_text.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                    
-                    copy_btn = ttk.Button(
-                        cmd_frame, text="Copy", width=6,
-                        command=lambda cmd=command: self._copy_to_clipboard(cmd)
-                    )
-                    copy_btn.pack(side=tk.RIGHT, padx=5)
-                    
-                    # Add Run button for non-comment commands
-                    if not command.strip().startswith('#') and not command.startswith('`'):
-                        run_btn = ttk.Button(
-                            cmd_frame, text="Run", width=6,
-                            command=lambda cmd=command: self._run_command(cmd)
-                        )
-                        run_btn.pack(side=tk.RIGHT, padx=0)
-                    
-                    row += 1
-                
-                # Add separator
-                separator = ttk.Separator(scrollable_frame, orient="horizontal")
-                separator.grid(row=row, column=0, sticky=tk.W+tk.E, pady=5)
-                row += 1
+        self.notebook = ttk.Notebook(self.dialog)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Create an empty tab per category, filled in the first time it is selected
+        self._pending_tabs = {}
+        for category, sections in _CHEATSHEET_CATEGORIES:
+            tab = tk.Frame(self.notebook, bg=self.theme_manager.bg_color, padx=10, pady=10)
+            self.notebook.add(tab, text=category)
+            self._pending_tabs[str(tab)] = (tab, sections)
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
         
         # Button frame
         btn_frame = tk.Frame(self.dialog, bg=self.theme_manager.bg_color)
@@ -203,29 +189,98 @@ class CheatSheetDialog:
             btn_frame, text="Export to File",
             command=self._export_cheat_sheet
         ).pack(side=tk.LEFT, padx=5)
+        
+        # Transient status next to the buttons, instead of a modal messagebox per action
+        self._toast_label = ttk.Label(btn_frame, text="", foreground="lime")
+        self._toast_label.pack(side=tk.LEFT, padx=5)
+        self._toast_after = None
+    
+    def _show_toast(self, message, duration=1500):
+        """Show a status message next to the buttons for duration milliseconds"""
+        if self._toast_after:
+            self.dialog.after_cancel(self._toast_after)
+        
+        self._toast_label.configure(text=message)
+        self._toast_after = self.dialog.after(duration, self._clear_toast)
+    
+    def _clear_toast(self):
+        """Clear the transient status message"""
+        self._toast_after = None
+        self._toast_label.configure(text="")
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's contents if it has not been shown yet"""
+        pending = self._pending_tabs.pop(self.notebook.select(), None)
+        if pending:
+            self._build_tab(*pending)
+    
+    def _build_tab(self, tab, sections):
+        """Render a category's sections into a tab"""
+        # One read-only Text per tab, commands are tagged runs with embedded buttons
+        text = tk.Text(
+            tab, wrap=tk.WORD,
+            bg=self.theme_manager.bg_color, fg=self.theme_manager.fg_color,
+            relief=tk.FLAT, highlightthickness=0, cursor="arrow"
+        )
+        scrollbar = ttk.Scrollbar(tab, orient="vertical", command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        
+        text.tag_configure(
+            "section", font=("Arial", 12, "bold"),
+            foreground=self.theme_manager.accent_color,
+            spacing1=10, spacing3=5
+        )
+        text.tag_configure(
+            "cmd", font=("Consolas", 10),
+            background="#2d2d2d", foreground="#aaffaa",
+            lmargin1=5, lmargin2=5, spacing1=2, spacing3=2
+        )
+        
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Add sections
+        for section_title, commands in sections:
+            text.insert(tk.END, f"{section_title}\n", "section")
+            
+            # Add commands
+            for command in commands:
+                text.insert(tk.END, command, "cmd")
+                text.insert(tk.END, "  ")
+                
+                # Add Run button for non-comment commands
+                if command in _RUNNABLE_COMMANDS:
+                    text.window_create(tk.END, window=ttk.Button(
+                        text, text="Run", width=6, style="Cheat.TButton",
+                        command=lambda cmd=command: self._run_command(cmd)
+                    ))
+                
+                text.window_create(tk.END, padx=5, window=ttk.Button(
+                    text, text="Copy", width=6, style="Cheat.TButton",
+                    command=lambda cmd=command: self._copy_to_clipboard(cmd)
+                ))
+                text.insert(tk.END, "\n")
+            
+            text.insert(tk.END, "\n")
+        
+        text.configure(state=tk.DISABLED)
     
     def _copy_to_clipboard(self, text):
         """Copy command to clipboard"""
         # Extract command part (before comment)
-        if '#' in text:
-            command_part = text.split('#')[0].strip()
-        else:
-            command_part = text.strip()
+        command_part = _CMD_STRIP.sub('', text).strip()
         
         # Copy to clipboard
         self.dialog.clipboard_clear()
         self.dialog.clipboard_append(command_part)
         
         # Show status message (optional)
-        messagebox.showinfo("Copied", "Command copied to clipboard.", parent=self.dialog)
+        self._show_toast("Command copied to clipboard.")
     
     def _run_command(self, command):
         """Run command in terminal"""
         # Extract command part (before comment)
-        if '#' in command:
-            command_part = command.split('#')[0].strip()
-        else:
-            command_part = command.strip()
+        command_part = _CMD_STRIP.sub('', command).strip()
         
         # Check for local SCP command
         if command_part.startswith('scp '):
@@ -260,94 +315,14 @@ class CheatSheetDialog:
             return
         
         try:
-            with open(filename, "w") as f:
-                f.write("# 🛠 Common Server Commands (Cheat Sheet)\n\n")
-                
-                # Define categories for export
-                categories = {
-                    "Connect to Server": [
-                        "ssh root@149.28.126.226      # VULTR",
-                        "ssh -v forgeadmin@209.145.57.9"
-                    ],
-                    "VIRTUAL ENV": [
-                        "source /var/www/myforge.ai/venv/bin/activate",
-                        "uvicorn server:app --host 0.0.0.0 --port=8080 --reload"
-                    ],
-                    "LAUNCH AI": [
-                        "cd /var/www/myforge.ai/llama.cpp/build/bin",
-                        "./llama-server -m ../../models/openchat-3.5-0106.Q4_K_M.gguf --port 8001 --threads 6",
-                        "sudo systemctl reload nginx",
-                        "pkill -f uvicorn"
-                    ],
-                    "Navigate Folders": [
-                        "cd /path/to/folder         # Change directory",
-                        "cd /var/www/myforge.ai      # (Your website files)",
-                        "cd /etc/nginx/sites-available  # (Nginx config files)",
-                        "cd ~                        # Go back to home directory"
-                    ],
-                    "List Files": [
-                        "ls                         # List files",
-                        "ls -l                      # Detailed list (permissions, size, date)"
-                    ],
-                    "Create / Edit Files": [
-                        "nano filename.ext          # Open/create file in Nano editor",
-                        "nano index.html            # Edit index.html"
-                    ],
-                    "Delete Files": [
-                        "rm filename.ext            # Delete file",
-                        "rm index.html              # Delete old index.html"
-                    ],
-                    "Upload Files From PC to Server (via SCP)": [
-                        "scp \"C:\\path\\to\\file.ext\" root@149.28.126.226:/path/on/server/",
-                        "Example:",
-                        "scp \"C:\\1bible\\mod\\new_index.html\" root@149.28.126.226:/var/www/myforge.ai/index.html"
-                    ],
-                    "Restart/Reload Services": [
-                        "systemctl reload nginx      # Reload Nginx after config changes",
-                        "systemctl restart nginx     # Full Nginx restart",
-                        "systemctl status nginx      # See if Nginx is running"
-                    ],
-                    "Test Nginx Configuration": [
-                        "nginx -t"
-                    ],
-                    "Run Python Scripts (in background)": [
-                        "nohup python3 server.py --port 42181 &",
-                        "nohup python3 yourscript.py &",
-                        "- `nohup` makes it survive even if you close the SSH session.",
-                        "- `&` runs it in the background."
-                    ],
-                    "View Running Processes": [
-                        "ps aux | grep python"
-                    ],
-                    "Kill a Process (if needed)": [
-                        "kill PID",
-                        "(Replace `PID` with the process ID you find from `ps aux | grep python`.)"
-                    ],
-                    "Basic Health Check": [
-                        "curl http://localhost:42181/health",
-                        "(Check if your local GPU API is still healthy.)"
-                    ],
-                    "Tips": [
-                        "`Tab` key → auto-completes filenames/directories.",
-                        "`Ctrl+C` → cancel current running command.",
-                        "`Ctrl+X` → exit Nano editor.",
-                        "`Ctrl+O` → save file in Nano.",
-                        "`Up Arrow` → show your last command again."
-                    ]
-                }
-                
-                # Write categories
-                for category, commands in categories.items():
-                    f.write(f"## 🔹 {category}\n```bash\n")
-                    for cmd in commands:
-                        f.write(f"{cmd}\n")
-                    f.write("```\n\n")
+            # Explicit encoding, the emoji headings fail under cp1252 on Windows.
+            # Written next to the target and swapped in, so a failed export leaves any old file intact
+            tmp_filename = f"{filename}.tmp"
+            with open(tmp_filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.write(_CHEATSHEET_MARKDOWN)
+            os.replace(tmp_filename, filename)
             
-            messagebox.showinfo(
-                "Export Complete",
-                f"Cheat sheet exported to {filename}",
-                parent=self.dialog
-            )
+            self._show_toast(f"Cheat sheet exported to {os.path.basename(filename)}", duration=3000)
         
         except Exception as e:
             messagebox.showerror(
@@ -400,6 +375,7 @@ class CommandEditorDialog:
         # Setup variables
         self.cmd_entries = {}  # Store Entry widgets
         self.current_row = 0   # Track current row for layout
+        self._scrollregion_pending = False  # Scrollregion update queued for idle
         
         # Setup UI
         self._setup_ui()
@@ -423,7 +399,7 @@ class CommandEditorDialog:
         scrollable_frame = tk.Frame(canvas, bg=self.theme_manager.bg_color)
         scrollable_frame.bind(
             "<Configure>",
-            lambda e, canvas=canvas: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e, canvas=canvas: self._schedule_scrollregion(canvas)
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -498,6 +474,19 @@ class CommandEditorDialog:
             command=self.dialog.destroy
         ).pack(side=tk.RIGHT, padx=10)
     
+    def _schedule_scrollregion(self, canvas):
+        """Queue one scrollregion update for the next idle pass"""
+        # Every added row fires <Configure>, so bbox is only recomputed once they settle
+        if self._scrollregion_pending:
+            return
+        self._scrollregion_pending = True
+        canvas.after_idle(self._update_scrollregion, canvas)
+    
+    def _update_scrollregion(self, canvas):
+        """Fit the canvas scrollregion to its contents"""
+        self._scrollregion_pending = False
+        canvas.configure(scrollregion=canvas.bbox("all"))
+    
     def _delete_command(self, name, frame):
         """Delete a command"""
         if name in self.cmd_entries:
@@ -551,12 +540,8 @@ class CommandEditorDialog:
     
     def _save_commands(self):
         """Save commands"""
-        # Collect commands from entries
-        new_commands = {}
-        
-        for cmd_name, entry in self.cmd_entries.items():
-            if entry.winfo_exists():  # Check if widget still exists
-                new_commands[cmd_name] = entry.get()
+        # Collect commands from entries, deleted rows are already gone from the dict
+        new_commands = {cmd_name: entry.get() for cmd_name, entry in self.cmd_entries.items()}
         
         # Update config
         self.config.set("commands", new_commands)
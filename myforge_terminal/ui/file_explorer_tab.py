@@ -7,17 +7,55 @@ Structure:
     FileExplorerTab:
       Description: Initialize file explorer tab
       - __init__(self, notebook, ssh_client, sftp_ops, config, logger, theme_manager)
-      - refresh_view(self)
+      - refresh_view(self, force=False)
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
+import fnmatch
 import os
+import posixpath
+import re
+import stat
 import threading
 import time
+from collections import OrderedDict
 
 from utils.ui_utils import ContextMenu, ProgressDialog, FileEditDialog
 
+# Navigation shortcuts
+_HOME_PATH = "/home"
+_WEBSITE_PATH = "/var/www/myforge.ai"
+
+# Modification time format for listings, applied with time.strftime per row
+_MTIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Sort key per column on the raw listing values, directories stay ahead of files
+_SORT_KEYS = {
+    'name': lambda item: item['name'].lower(),
+    'size': lambda item: item['size'] or 0,
+    'type': lambda item: item['type'],
+    'modified': lambda item: item['mtime'] or 0,
+    'permissions': lambda item: item['mode'] or 0,
+}
+
+# Selection must be stable this long before a preview is fetched
+_PREVIEW_DELAY_MS = 150
+
+# Display units for _format_size with their divisors, one per power of 1024
+_SIZE_UNITS = (('B', 1), ('KB', 1 << 10), ('MB', 1 << 20), ('GB', 1 << 30), ('TB', 1 << 40))
+
+# Extensions (without the dot) of files that can be previewed and edited as text
+_TEXT_EXT = frozenset({
+    'txt', 'py', 'js', 'html', 'css', 'json', 'xml', 'md',
+    'ini', 'conf', 'cfg', 'log', 'sh', 'bash', 'php', 'c',
+    'cpp', 'h', 'java', 'yaml', 'yml', 'toml', 'csv', 'lua',
+    'ts', 'sql'
+})
+
+# Tcl lambda setting the text of a list of widgets to a list of values in one call
+_SET_TEXTS_LAMBDA = ('widgets texts', 'foreach widget $widgets text $texts { $widget configure -text $text }')
+
 class FileExplorerTab:
     def __init__(self, notebook, ssh_client, sftp_ops, config, logger, theme_manager):
         """Initialize file explorer tab"""
@@ -32,11 +70,56 @@ class FileExplorerTab:
         self.frame = tk.Frame(notebook, bg=theme_manager.bg_color)
         
         # Set default path
-        self.current_path = "/var/www/myforge.ai"
+        self.current_path = _WEBSITE_PATH
         
         # File selection state
         self.selected_items = []
         self.unfiltered_items = [] # For client-side filtering
+        self._name_lower = []  # Lowercased names parallel to unfiltered_items
+        self._filter_after_id = None  # Pending debounce or idle-time filter slice
+        self._filter_slice = 5000
+        
+        # Recent directory listings, path -> (time listed, items), oldest first
+        self._dircache = OrderedDict()
+        self._dircache_max = 64
+        self._dircache_ttl = 30.0
+        self._dircache_recheck_age = 5.0  # Cache hits older than this are re-listed in the background
+        self._dircache_server = None  # Listings are only valid for the server they came from
+        
+        # Path of the listing request still waiting for its reply, and the generation of the
+        # listing the tree shows. Replies carrying an older generation are stale
+        self._inflight_path = None
+        self._listing_gen = 0
+        
+        # Background listings of the parent and first subdirectories, see _prefetch. All of
+        # this state is only touched on the Tk thread
+        self._prefetch_max = 5
+        self._prefetch_inflight = set()
+        self._prefetch_pending = []  # Candidates waiting for one of the two prefetch slots
+        self._prefetch_running = 0
+        self._prefetch_after_id = None
+        self._select_prefetch_id = None  # Pending listing of the selected directory
+        
+        # Rows still to be inserted, added in idle-time batches by _insert_batch. The
+        # first batch only fills the viewport so it is drawn before the rest go in
+        self._insert_batch_size = 500
+        self._row_height = None
+        self._row_seq = 0
+        self._pending_items = []
+        self._pending_index = 0
+        self._insert_after_id = None
+        
+        # Listing dict behind each tree row, keyed by iid
+        self._row_meta = {}
+        
+        # Formatted (item, values, tags) per listing dict, keyed by id(item) and kept for the
+        # current listing so filtering and sorting reinsert rows without formatting them again
+        self._display_rows = {}
+        
+        # Pending preview fetch, and recent previews as path -> (mtime, text)
+        self._preview_after_id = None
+        self._preview_cache = OrderedDict()
+        self._preview_cache_max = 128
         
         # Setup UI
         self._setup_ui()
@@ -82,15 +165,15 @@ class FileExplorerTab:
         
         # Home button
         ttk.Button(nav_frame, text="Home", 
-                  command=lambda: self._navigate_to_path("/home")).pack(side=tk.LEFT, padx=(0,5))
+                  command=lambda: self._navigate_to_path(_HOME_PATH)).pack(side=tk.LEFT, padx=(0,5))
         
         # Website button
         ttk.Button(nav_frame, text="Website", 
-                  command=lambda: self._navigate_to_path("/var/www/myforge.ai")).pack(side=tk.LEFT, padx=(0,5))
+                  command=lambda: self._navigate_to_path(_WEBSITE_PATH)).pack(side=tk.LEFT, padx=(0,5))
         
         # Refresh button
         ttk.Button(nav_frame, text="↻", width=3, 
-                  command=self.refresh_view).pack(side=tk.RIGHT, padx=(0,0))
+                  command=lambda: self.refresh_view(force=True)).pack(side=tk.RIGHT, padx=(0,0))
     
     def _setup_explorer_frame(self):
         """Set up the main file explorer frame"""
@@ -118,12 +201,14 @@ class FileExplorerTab:
             # Style is inherited from MainWindow's _apply_custom_styles
         )
         
-        # Define column headings (styling is via "Treeview.Heading" style)
-        self.file_tree.heading("name", text="Name")
-        self.file_tree.heading("size", text="Size")
-        self.file_tree.heading("type", text="Type")
-        self.file_tree.heading("modified", text="Modified")
-        self.file_tree.heading("permissions", text="Permissions")
+        # Define column headings (styling is via "Treeview.Heading" style), click to sort
+        self.file_tree.heading("name", text="Name", command=lambda: self._sort_by("name"))
+        self.file_tree.heading("size", text="Size", command=lambda: self._sort_by("size"))
+        self.file_tree.heading("type", text="Type", command=lambda: self._sort_by("type"))
+        self.file_tree.heading("modified", text="Modified", command=lambda: self._sort_by("modified"))
+        self.file_tree.heading("permissions", text="Permissions", command=lambda: self._sort_by("permissions"))
+        self._sort_column = None
+        self._sort_reverse = False
         
         # Configure column widths
         self.file_tree.column("name", width=250, stretch=True) # Increased width for name
@@ -142,6 +227,19 @@ class FileExplorerTab:
         hsb.pack(side=tk.BOTTOM, fill=tk.X)
         self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Tcl lambda inserting a list of {iid values tags} rows, see _insert_batch
+        self._insert_rows_lambda = (
+            'rows',
+            f'foreach row $rows {{ lassign $row id vals tags; {self.file_tree} insert {{}} end -id $id -values $vals -tags $tags }}'
+        )
+        
+        # Configure row tags once, using theme-consistent colors
+        tm = self.theme_manager
+        self.file_tree.tag_configure('directory', foreground=getattr(tm, 'accent_color_2', '#77ccff')) # Brighter for dirs
+        self.file_tree.tag_configure('file', foreground=tm.fg_color)
+        self.file_tree.tag_configure('link', foreground=getattr(tm, 'warning_color', '#ffaa77')) # Assuming a warning/special color
+        self.file_tree.tag_configure('parent', foreground=getattr(tm, 'disabled_fg_color', '#aaaaaa'))
+        
         # Bind events
         self.file_tree.bind("<Double-1>", self._on_item_double_click)
         self.file_tree.bind("<Button-3>", self._show_context_menu)
@@ -162,38 +260,29 @@ class FileExplorerTab:
         details_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(5, 0))
         details_frame.pack_propagate(False)  # Prevent shrinking
         
-        # Details content
-        self.details_name = tk.StringVar(value="")
-        self.details_path = tk.StringVar(value="")
-        self.details_size = tk.StringVar(value="")
-        self.details_type = tk.StringVar(value="")
-        self.details_modified = tk.StringVar(value="")
-        self.details_perms = tk.StringVar(value="")
-        
-        # Details labels
-        detail_labels = [
-            ("Name:", self.details_name),
-            ("Path:", self.details_path),
-            ("Size:", self.details_size),
-            ("Type:", self.details_type),
-            ("Modified:", self.details_modified),
-            ("Permissions:", self.details_perms)
-        ]
-        
-        for i, (label_text, var) in enumerate(detail_labels):
-            label_frame = tk.Frame(details_frame, bg=tm.bg_color) # Use tm.bg_color for LabelFrame's internal bg
-            label_frame.pack(fill=tk.X, padx=10, pady=3, anchor=tk.W) # Increased padx/pady
-            
+        # Details rows, caption and value label pairs in a single grid
+        details_grid = tk.Frame(details_frame, bg=tm.bg_color) # Use tm.bg_color for LabelFrame's internal bg
+        details_grid.pack(fill=tk.X, padx=10, pady=3, anchor=tk.W)
+        details_grid.columnconfigure(1, weight=1)
+        
+        captions = ("Name:", "Path:", "Size:", "Type:", "Modified:", "Permissions:")
+        value_labels = []
+        for i, caption in enumerate(captions):
             tk.Label(
-                label_frame, text=label_text, width=12, anchor=tk.W, # Increased width for alignment
-                bg=tm.bg_color, fg=tm.fg_color 
-            ).pack(side=tk.LEFT)
+                details_grid, text=caption, width=12, anchor=tk.W, # Increased width for alignment
+                bg=tm.bg_color, fg=tm.fg_color
+            ).grid(row=i, column=0, sticky=tk.W, pady=3)
             
-            detail_label = tk.Label(
-                label_frame, textvariable=var, anchor=tk.W, wraplength=180, # Added wraplength for long paths
+            value_label = tk.Label(
+                details_grid, anchor=tk.W, justify=tk.LEFT, wraplength=180, # Added wraplength for long paths
                 bg=tm.bg_color, fg=tm.fg_color
             )
-            detail_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            value_label.grid(row=i, column=1, sticky=tk.EW, pady=3)
+            value_labels.append(value_label)
+        
+        # Value label paths for _set_details, and the path of the item they describe
+        self._detail_widgets = tuple(str(label) for label in value_labels)
+        self._details_path = ""
         
         # Preview frame (Use ttk.LabelFrame)
         preview_frame = ttk.LabelFrame(
@@ -202,14 +291,16 @@ class FileExplorerTab:
         )
         preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(10,5)) # Added top margin
         
-        self.preview_label = tk.Label(
-            preview_frame, text="No preview available",
+        # Read-only Text rather than a Label, which rewraps its whole string on every change
+        self.preview_text = tk.Text(
+            preview_frame, wrap=tk.WORD, height=10,
             bg=tm.input_bg_color, # Use ThemeManager input color
             fg=tm.input_fg_color, # Use ThemeManager input color
-            wraplength=details_frame.cget('width') - 40, # Adjust wraplength dynamically
-            justify=tk.LEFT,
+            relief=tk.FLAT, borderwidth=0,
             padx=5, pady=5)
-        self.preview_label.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.preview_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._preview_shown = None
+        self._set_preview("No preview available")
     
     def _setup_action_buttons(self):
         """Set up action buttons for file operations"""
@@ -224,6 +315,11 @@ class FileExplorerTab:
             command=self._upload_files
         ).pack(side=tk.LEFT, padx=action_button_padx)
         
+        ttk.Button(
+            btn_frame, text="Upload Folder", 
+            command=self._upload_folder
+        ).pack(side=tk.LEFT, padx=action_button_padx)
+        
         ttk.Button(
             btn_frame, text="New Folder", 
             command=self._create_new_folder
@@ -260,6 +356,7 @@ class FileExplorerTab:
         
         self.context_menu.add_command(label="Download", command=self._download_selected)
         self.context_menu.add_command(label="Upload Here", command=self._upload_files)
+        self.context_menu.add_command(label="Upload Folder Here", command=self._upload_folder)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Edit", command=self._edit_selected_file)
         self.context_menu.add_command(label="Rename", command=self._rename_selected)
@@ -268,9 +365,13 @@ class FileExplorerTab:
         self.context_menu.add_command(label="New Folder", command=self._create_new_folder)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Refresh", command=self.refresh_view)
+        self.context_menu.add_command(label="Force Refresh", command=lambda: self.refresh_view(force=True))
+        
+        # Enabled state last applied per entry label, see _update_context_menu
+        self._ctx_state = {}
     
-    def refresh_view(self):
-        """Refresh the file listing"""
+    def refresh_view(self, force=False):
+        """Refresh the file listing, from the listing cache unless force is set"""
         if not self.ssh_client.connected:
             messagebox.showinfo("Not Connected", 
                              "Please connect to a server first.")
@@ -287,56 +388,99 @@ class FileExplorerTab:
         # If we have unfiltered items and the filter entry is not empty,
         # it means this is a manual refresh. We should re-apply the filter to existing items.
         # Otherwise, list the directory from SFTP.
-        if self.unfiltered_items and hasattr(self, 'filter_var') and self.filter_var.get():
-             self._on_filter_changed() # Re-apply current filter to existing items
+        if not force and self.unfiltered_items and hasattr(self, 'filter_var') and self.filter_var.get():
+             self._apply_filter() # Re-apply current filter to existing items
         else:
+            # The same listing is already on its way, let that reply fill the tree
+            if self._inflight_path == self.current_path:
+                return
+            
             # This is a fresh load or filter is empty.
             # Clear the tree explicitly before fetching new items to avoid flashing old content.
-            for item_id in self.file_tree.get_children():
-                self.file_tree.delete(item_id)
-            self.sftp_ops.list_directory(
+            self._clear_tree()
+            self._listing_gen += 1
+            self._inflight_path = None
+            
+            server = (self.ssh_client.hostname, self.ssh_client.port)
+            if server != self._dircache_server:
+                self._dircache.clear()
+                self._dircache_server = server
+                self._prefetch_pending = []
+            
+            # Serve a recent listing without an SFTP round-trip
+            cached_items = None if force else self._get_cached_listing(self.current_path)
+            if cached_items is not None:
+                self._on_directory_listed(True, cached_items, None, self.current_path, from_cache=True)
+                self._revalidate_listing(self.current_path)
+                return
+            
+            # Rows are drawn as each batch of entries arrives, then put in sorted order
+            self._inflight_path = self.current_path
+            gen = self._listing_gen
+            self.sftp_ops.list_directory_stream(
                 self.current_path, 
-                on_complete=self._on_directory_listed 
+                on_batch=lambda entries, gen=gen: self._append_batch(gen, entries),
+                on_complete=lambda success, items, error, path=self.current_path, gen=gen:
+                    self._on_directory_listed(success, items, error, path, gen)
             )
     
-    def _on_directory_listed(self, success, items, error_message):
-        """Handle directory listing completion"""
+    def _on_directory_listed(self, success, items, error_message, path=None, gen=None, from_cache=False):
+        """Handle directory listing completion, from_cache for items served from _dircache"""
+        if gen is not None:
+            # Superseded by a later listing, which may be of the same path
+            if gen != self._listing_gen:
+                if success:
+                    self._cache_listing(path, items)
+                return
+            self._inflight_path = None
+        
         if not success:
+            # Drop any rows streamed in before the failure
+            if path == self.current_path:
+                self._clear_tree()
             messagebox.showerror("Error", f"Failed to list directory: {error_message}")
             return
         
+        # A reply for a directory the user has already left is only worth caching
+        if path is not None and path != self.current_path:
+            self._cache_listing(path, items)
+            return
+        
         # Update path
-        self.current_path = self.sftp_ops.current_remote_path
+        self.current_path = path or self.sftp_ops.current_remote_path
         self.path_var.set(self.current_path)
         
-        # Add items to tree
-        for item in items:
-            # Format size for display
-            if item['type'] == 'directory':
-                size_str = "<DIR>"
-            else:
-                size_str = self._format_size(item['size'])
-            
-            # Insert into tree
-            self.file_tree.insert(
-                "", "end",
-                values=(
-                    item['name'],
-                    size_str,
-                    item['type'],
-                    item['modified'],
-                    item['permissions']
-                ),
-                tags=(item['type'], "parent" if item.get('is_parent', False) else "")
-            )
+        # A cache hit keeps its original time, so the recheck age and TTL still count from
+        # when the server was last asked. Only its LRU position moves
+        if from_cache:
+            self._dircache.move_to_end(self.current_path)
+        else:
+            self._cache_listing(self.current_path, items)
+        
+        # Base list for the filter, names lowercased once per listing rather than per keystroke
+        if items is not self.unfiltered_items:
+            self._display_rows = {}
+        self.unfiltered_items = items
+        self._name_lower = [item['name'].lower() for item in items]
+        
+        # Speculatively list where the user is likely to go next, once the tree is drawn
+        if self._prefetch_after_id:
+            self.frame.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.frame.after_idle(self._prefetch, self.current_path, items)
+        
+        # Typed while the listing was loading
+        if self.filter_var.get():
+            self._apply_filter()
+            return
         
-        # Configure tags
-        # Configure tags - using more theme-consistent colors
-        tm = self.theme_manager
-        self.file_tree.tag_configure('directory', foreground=getattr(tm, 'accent_color_2', '#77ccff')) # Brighter for dirs
-        self.file_tree.tag_configure('file', foreground=tm.fg_color)
-        self.file_tree.tag_configure('link', foreground=getattr(tm, 'warning_color', '#ffaa77')) # Assuming a warning/special color
-        self.file_tree.tag_configure('parent', foreground=getattr(tm, 'disabled_fg_color', '#aaaaaa'))
+        # Add items to tree, reusing the rows already streamed in when they are all there
+        if self._insert_after_id is None and len(self._row_meta) == len(items):
+            iids = {id(item): iid for iid, item in self._row_meta.items()}
+            order = [iids.get(id(item)) for item in items]
+            if None not in order:
+                self.file_tree.set_children("", *order)
+                return
+        self._populate_tree(items)
 
     def _setup_filter_bar(self):
         """Set up the filter bar for file and folder names."""
@@ -366,36 +510,108 @@ class FileExplorerTab:
 
     def _apply_filter_and_refresh_tree(self, items_to_display):
         """Clears and repopulates the file_tree with the given items."""
-        for item_id in self.file_tree.get_children():
-            self.file_tree.delete(item_id)
-        
-        if not items_to_display: 
+        self._populate_tree(items_to_display)
+    
+    def _clear_tree(self):
+        """Remove all rows, including any still waiting to be inserted"""
+        if self._insert_after_id:
+            self.frame.after_cancel(self._insert_after_id)
+            self._insert_after_id = None
+        self._pending_items = []
+        self._pending_index = 0
+        self._row_meta = {}
+        
+        # One Tcl call for all rows rather than one per row
+        children = self.file_tree.get_children()
+        if children:
+            self.file_tree.delete(*children)
+    
+    def _populate_tree(self, items):
+        """Replace the tree rows with items, inserting the first batch now and the rest when idle"""
+        self._clear_tree()
+        self._pending_items = items
+        self._insert_batch()
+    
+    def _visible_rows(self):
+        """Number of rows that fit in the tree viewport"""
+        if self._row_height is None:
+            self._row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return self.file_tree.winfo_height() // self._row_height + 1
+    
+    def _append_batch(self, gen, entries):
+        """Queue streamed listing entries for insertion while their listing is still current"""
+        if gen != self._listing_gen or self.filter_var.get():
             return
-
-        for item in items_to_display:
-            # Format size for display
-            if item['type'] == 'directory':
-                size_str = "<DIR>"
-            else:
-                size_str = self._format_size(item['size'])
-            
-            # Insert into tree
-            self.file_tree.insert(
-                "", "end",
-                values=(
+        
+        self._pending_items.extend(entries)
+        if self._insert_after_id is None:
+            self._insert_batch()
+    
+    def _insert_batch(self):
+        """Insert the next batch of pending rows, rescheduling until all are shown"""
+        self._insert_after_id = None
+        if self._pending_index == 0:
+            end = self._visible_rows()
+        else:
+            end = self._pending_index + self._insert_batch_size
+        
+        # Rows go to Tcl as one list and are inserted by a single apply call rather than
+        # one Treeview.insert per row, Python tuples become Tcl lists without any quoting
+        format_size = self._format_size
+        format_mtime = self._format_mtime
+        format_mode = self._format_mode
+        row_meta = self._row_meta
+        display_rows = self._display_rows
+        rows = []
+        
+        for item in self._pending_items[self._pending_index:end]:
+            display = display_rows.get(id(item))
+            if display is None:
+                # Format size for display
+                if item['type'] == 'directory':
+                    size_str = "<DIR>"
+                else:
+                    size_str = format_size(item['size'])
+                
+                values = (
                     item['name'],
                     size_str,
                     item['type'],
-                    item['modified'],
-                    item['permissions']
-                ),
-                tags=(item['type'], "parent" if item.get('is_parent', False) else "")
-            )
-        # Note: Tag configuration is assumed to be done once elsewhere or will be handled
-        # if theme changes require it.
+                    format_mtime(item['mtime']),
+                    format_mode(item['mode'])
+                )
+                tags = (item['type'], "parent" if item.get('is_parent', False) else "")
+                
+                # The entry holds the item itself so its id cannot be reused while cached
+                display = display_rows[id(item)] = (item, values, tags)
+            else:
+                values, tags = display[1], display[2]
+            
+            # Explicit iids, keeping the listing dict for selection lookups
+            self._row_seq += 1
+            iid = f"r{self._row_seq}"
+            rows.append((iid, values, tags))
+            row_meta[iid] = item
+        
+        if rows:
+            self.file_tree.tk.call('apply', self._insert_rows_lambda, tuple(rows))
+        
+        # Yield to the event loop between batches so large directories stay responsive
+        self._pending_index = min(end, len(self._pending_items))
+        if end < len(self._pending_items):
+            self._insert_after_id = self.frame.after_idle(self._insert_batch)
 
     def _on_filter_changed(self, event=None):
-        """Handle filter text changes and update the tree view."""
+        """Handle filter text changes, applying the filter once typing pauses for 120 ms"""
+        if self._filter_after_id:
+            self.frame.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.frame.after(120, self._apply_filter)
+    
+    def _apply_filter(self):
+        """Update the tree view with the items matching the filter text"""
+        if self._filter_after_id:
+            self.frame.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
         filter_text = self.filter_var.get().lower()
         
         if not self.unfiltered_items: # No base items to filter
@@ -408,23 +624,44 @@ class FileExplorerTab:
             self._apply_filter_and_refresh_tree(self.unfiltered_items)
             return
 
-        filtered_items = []
-        parent_item = None # To store '..' if found
-        for item_data in self.unfiltered_items:
-            if item_data.get('is_parent', False):
-                parent_item = item_data 
-                continue # Don't filter '..' itself by name
-            if filter_text in item_data['name'].lower():
-                filtered_items.append(item_data)
-        
-        if parent_item: # Add '..' at the beginning if it was originally there and not filtered out
-            filtered_items.insert(0, parent_item)
-            
+        # Wildcards switch to a glob match, compiled once for the whole listing
+        if any(c in filter_text for c in '*?['):
+            pattern = re.compile(fnmatch.translate(filter_text))
+        else:
+            pattern = None
+        
+        # '..' always comes first when present and is kept regardless of the filter
+        items = self.unfiltered_items
+        start = 1 if items[0].get('is_parent', False) else 0
+        self._filter_step(items, self._name_lower, filter_text, pattern, start, items[:start])
+    
+    def _filter_step(self, items, names, filter_text, pattern, index, filtered_items):
+        """Filter one slice of the listing, continuing when idle so typing stays responsive"""
+        self._filter_after_id = None
+        end = index + self._filter_slice
+        
+        if pattern is None:
+            filtered_items += [item for item, name in zip(items[index:end], names[index:end])
+                               if filter_text in name]
+        else:
+            match = pattern.match
+            filtered_items += [item for item, name in zip(items[index:end], names[index:end])
+                               if match(name)]
+        
+        if end < len(items):
+            self._filter_after_id = self.frame.after_idle(
+                self._filter_step, items, names, filter_text, pattern, end, filtered_items
+            )
+            return
+        
         self._apply_filter_and_refresh_tree(filtered_items)
 
     def _clear_filter(self):
         """Clear the filter entry and refresh the tree to show all items."""
         self.filter_var.set("") # Clear the filter variable which also clears entry
+        if self._filter_after_id:
+            self.frame.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
         if self.unfiltered_items: # Only refresh if there are items to show
             self._apply_filter_and_refresh_tree(self.unfiltered_items)
         else: # If no unfiltered items, ensure tree is empty
@@ -436,23 +673,13 @@ class FileExplorerTab:
         if not selection:
             return
         
-        item_id = selection[0]
-        item_values = self.file_tree.item(item_id, "values")
-        
-        if not item_values:
+        item = self._row_meta.get(selection[0])
+        if not item:
             return
         
-        name, size, item_type = item_values[0], item_values[1], item_values[2]
-        
-        if item_type == 'directory':
-            # Navigate to directory
-            if name == '..':
-                # Go up one level
-                self._navigate_to_path(os.path.dirname(self.current_path))
-            else:
-                # Go into directory
-                new_path = os.path.join(self.current_path, name)
-                self._navigate_to_path(new_path)
+        if item['type'] == 'directory':
+            # Navigate to directory, '..' carries its parent path, usually served from the cache
+            self._navigate_to_path(item['path'])
         else:
             # Open file for editing
             self._edit_selected_file()
@@ -465,107 +692,131 @@ class FileExplorerTab:
             self.selected_items = []
             return
         
-        # Get selected items
-        self.selected_items = []
-        for item_id in selection:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values:
-                continue
-            
-            name, size_str, item_type, modified, perms = item_values
-            path = os.path.join(self.current_path, name) if name != '..' else os.path.dirname(self.current_path)
-            
-            # Convert size string back to number
-            if size_str == "<DIR>":
-                size = 0
-            else:
-                try:
-                    if "KB" in size_str:
-                        size = float(size_str.replace("KB", "").strip()) * 1024
-                    elif "MB" in size_str:
-                        size = float(size_str.replace("MB", "").strip()) * 1024 * 1024
-                    elif "GB" in size_str:
-                        size = float(size_str.replace("GB", "").strip()) * 1024 * 1024 * 1024
-                    else:
-                        size = float(size_str.replace("B", "").strip())
-                except ValueError:
-                    size = 0
-            
-            self.selected_items.append({
-                'name': name,
-                'path': path,
-                'type': item_type,
-                'size': size,
-                'modified': modified,
-                'permissions': perms,
-                'is_parent': name == '..'
-            })
+        # Get selected items, straight from the listing rather than the displayed values
+        self.selected_items = [self._row_meta[item_id] for item_id in selection
+                               if item_id in self._row_meta]
         
         # Update details for first selected item
         if self.selected_items:
             self._update_details(self.selected_items[0])
+        
+        # A single selected directory is usually opened next, list it once the selection settles
+        if self._select_prefetch_id:
+            self.frame.after_cancel(self._select_prefetch_id)
+            self._select_prefetch_id = None
+        if len(self.selected_items) == 1:
+            item = self.selected_items[0]
+            if item['type'] == 'directory' and not item.get('is_parent', False):
+                self._select_prefetch_id = self.frame.after(
+                    200, lambda p=item['path']: self._prefetch_selected(p)
+                )
     
     def _update_details(self, item):
         """Update details panel with item information"""
-        self.details_name.set(item['name'])
-        self.details_path.set(item['path'])
-        
         if item['type'] == 'directory':
-            self.details_size.set("<Directory>")
+            size_str = "<Directory>"
         else:
-            self.details_size.set(self._format_size(item['size']))
+            size_str = self._format_size(item['size'])
         
-        self.details_type.set(item['type'].capitalize())
-        self.details_modified.set(item['modified'])
-        self.details_perms.set(item['permissions'])
+        self._set_details(
+            item['name'],
+            item['path'],
+            size_str,
+            item['type'].capitalize(),
+            self._format_mtime(item['mtime']),
+            self._format_mode(item['mode'])
+        )
         
-        # Update preview (for text files)
-        if item['type'] == 'file' and self._is_text_file(item['name']):
-            # Get file preview
-            self._show_file_preview(item['path'])
+        # Update preview (for text files, and files without an extension such as scripts
+        # and dotfiles, which are sniffed once their first bytes arrive)
+        self._cancel_preview()
+        name = item['name']
+        if item['type'] == 'file' and (self._is_text_file(name) or '.' not in name.lstrip('.')):
+            # Fetch only once the selection settles, so arrow-key scrubbing costs one request
+            self._preview_after_id = self.frame.after(
+                _PREVIEW_DELAY_MS, lambda i=item: self._show_file_preview(i['path'], mtime=i.get('mtime'), size=i.get('size'))
+            )
         else:
-            self.preview_label.config(text="No preview available")
+            self._set_preview("No preview available")
+    
+    def _set_details(self, *values):
+        """Set the six detail fields, in panel order, with a single Tcl call"""
+        self._details_path = values[1]
+        self.frame.tk.call('apply', _SET_TEXTS_LAMBDA, self._detail_widgets, values)
+    
+    def _set_preview(self, text):
+        """Show text in the preview pane, leaving it alone if it already shows that text"""
+        if text == self._preview_shown:
+            return
+        self._preview_shown = text
+        
+        self.preview_text.configure(state=tk.NORMAL)
+        self.preview_text.delete("1.0", tk.END)
+        self.preview_text.insert("1.0", text)
+        self.preview_text.configure(state=tk.DISABLED)
+    
+    def _cancel_preview(self):
+        """Cancel a scheduled preview fetch"""
+        if self._preview_after_id:
+            self.frame.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
     
     def _clear_details(self):
         """Clear details panel"""
-        self.details_name.set("")
-        self.details_path.set("")
-        self.details_size.set("")
-        self.details_type.set("")
-        self.details_modified.set("")
-        self.details_perms.set("")
-        self.preview_label.config(text="No preview available")
-    
-    def _show_file_preview(self, path, max_size=1024*10):
-        """Show a preview of the file content"""
+        self._set_details("", "", "", "", "", "")
+        self._cancel_preview()
+        self._set_preview("No preview available")
+    
+    def _show_file_preview(self, path, max_size=1024*10, mtime=None, size=None):
+        """Show a preview of the file content, reusing the last one if the file is unchanged"""
+        self._preview_after_id = None
         if not self.ssh_client.connected:
             return
         
+        cached = self._preview_cache.get(path)
+        if cached and mtime is not None and cached[0] == mtime:
+            self._preview_cache.move_to_end(path)
+            self._set_preview(cached[1])
+            return
+        
         def on_content_loaded(success, content, error):
-            if success and content:
-                # Limit preview size
-                preview_text = content[:max_size]
-                if len(content) > max_size:
+            if success and content and '\x00' in content:
+                # NUL bytes mean binary data
+                preview_text = "No preview available"
+            elif success and content:
+                # Only max_size bytes were read, without the listed size a full read means there may be more
+                preview_text = content
+                if size > max_size if size is not None else len(content) >= max_size:
                     preview_text += "\n...(file truncated)..."
-                self.preview_label.config(text=preview_text)
+                
+                if mtime is not None:
+                    self._preview_cache[path] = (mtime, preview_text)
+                    self._preview_cache.move_to_end(path)
+                    if len(self._preview_cache) > self._preview_cache_max:
+                        self._preview_cache.popitem(last=False)
             else:
-                self.preview_label.config(text="Preview failed to load")
+                preview_text = "Preview failed to load"
+            
+            # The selection may have moved on while the file was read
+            if self._details_path == path:
+                self._set_preview(preview_text)
         
-        # Get file content
-        self.sftp_ops.get_file_content(path, on_complete=on_content_loaded)
+        # Get the start of the file
+        self.sftp_ops.get_file_head(path, max_size, on_complete=on_content_loaded)
     
     def _navigate_to_path(self, path):
         """Navigate to a different directory"""
         if not self.ssh_client.connected:
             return
         
-        # Normalize path separators for SFTP
-        path = path.replace("\\", "/")
-
         # Clear filter when navigating to a new path
         if hasattr(self, 'filter_var'): # Check if filter_var is initialized
             self.filter_var.set("") 
+        if self._filter_after_id:
+            self.frame.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
         self.unfiltered_items = [] # Clear previous directory's items
+        self._name_lower = []
 
         # Update current path and refresh view
         self.current_path = path
@@ -574,20 +825,40 @@ class FileExplorerTab:
     
     def _on_path_changed(self, event=None):
         """Handle path entry change"""
-        new_path = self.path_var.get()
+        # Typed paths may use Windows separators, remote paths are POSIX
+        new_path = self.path_var.get().replace("\\", "/")
         if new_path and new_path != self.current_path:
             self._navigate_to_path(new_path)
     
     def _show_context_menu(self, event):
         """Show context menu on right-click"""
-        # Select item under cursor if not already selected
-        item = self.file_tree.identify('item', event.x, event.y)
+        # Select item under cursor if not already selected. <<TreeviewSelect>> is only
+        # delivered later, so selected_items is brought up to date here
+        item = self.file_tree.identify_row(event.y)
         if item and item not in self.file_tree.selection():
             self.file_tree.selection_set(item)
+            self._on_selection_changed(None)
         
-        # Show menu
-        if self.file_tree.selection():
-            self.context_menu.post(event.x_root, event.y_root)
+        # Show menu, tk_popup releases its grab when the menu closes
+        if self.selected_items:
+            self._update_context_menu()
+            self.context_menu.tk_popup(event.x_root, event.y_root)
+    
+    def _update_context_menu(self):
+        """Enable the entries that apply to the selection, reconfiguring only those that changed"""
+        first = self.selected_items[0]
+        has_items = any(not item.get('is_parent', False) for item in self.selected_items)
+        states = {
+            "Download": has_items,
+            "Edit": first['type'] == 'file' and self._is_text_file(first['name']),
+            "Rename": not first.get('is_parent', False),
+            "Delete": has_items,
+        }
+        
+        for label, enabled in states.items():
+            if self._ctx_state.get(label) != enabled:
+                self._ctx_state[label] = enabled
+                self.context_menu.entryconfig(label, state=tk.NORMAL if enabled else tk.DISABLED)
     
     def _download_selected(self):
         """Download selected files and directories"""
@@ -611,6 +882,11 @@ class FileExplorerTab:
         if not download_dir:
             return
         
+        # A single directory goes as one tar stream, see _download_tree
+        if len(items_to_download) == 1 and items_to_download[0]['type'] == 'directory':
+            self._download_tree(items_to_download[0], download_dir)
+            return
+        
         # Start download with progress dialog
         progress_dialog = ProgressDialog(
             self.frame, 
@@ -648,6 +924,83 @@ class FileExplorerTab:
             on_complete=on_complete
         )
     
+    def _download_tree(self, item, download_dir):
+        """Download one directory as a tar stream, falling back to SFTP when the server has no tar"""
+        progress_dialog = ProgressDialog(
+            self.frame, 
+            "Downloading Folder",
+            f"Downloading {item['name']}...",
+            self.theme_manager
+        )
+        
+        def on_complete(success, error):
+            progress_dialog.close()
+            
+            if success:
+                messagebox.showinfo(
+                    "Download Complete",
+                    f"Downloaded folder '{item['name']}' successfully."
+                )
+            else:
+                messagebox.showerror(
+                    "Download Failed",
+                    f"Download failed: {error}"
+                )
+        
+        self.sftp_ops.download_tree_fast(item['path'], download_dir, on_complete=on_complete)
+    
+    def _upload_folder(self):
+        """Upload a local folder into the current directory as a tar stream"""
+        if not self.ssh_client.connected:
+            messagebox.showinfo("Not Connected", 
+                             "Please connect to a server first.")
+            return
+        
+        local_dir = filedialog.askdirectory(
+            title="Select Folder to Upload"
+        )
+        
+        if not local_dir:
+            return
+        
+        folder_name = os.path.basename(os.path.normpath(local_dir))
+        remote_dir = self.current_path
+        
+        # tar merges into an existing folder of the same name, overwriting its files
+        if any(item['name'] == folder_name for item in self.unfiltered_items):
+            if not messagebox.askyesno(
+                "Confirm Upload",
+                f"'{folder_name}' already exists here. Merge into it, overwriting files with the same name?",
+                default=messagebox.NO
+            ):
+                return
+        
+        progress_dialog = ProgressDialog(
+            self.frame, 
+            "Uploading Folder",
+            f"Uploading {folder_name}...",
+            self.theme_manager
+        )
+        
+        def on_complete(success, error):
+            progress_dialog.close()
+            
+            if success:
+                messagebox.showinfo(
+                    "Upload Complete",
+                    f"Uploaded folder '{folder_name}' successfully."
+                )
+                self._add_entries(remote_dir, [
+                    self._local_entry(remote_dir, folder_name, 'directory', 0, stat.S_IFDIR | 0o755)
+                ])
+            else:
+                messagebox.showerror(
+                    "Upload Failed",
+                    f"Upload failed: {error}"
+                )
+        
+        self.sftp_ops.upload_tree_fast(local_dir, remote_dir, on_complete=on_complete)
+    
     def _upload_files(self):
         """Upload files to current directory"""
         if not self.ssh_client.connected:
@@ -684,6 +1037,8 @@ class FileExplorerTab:
                 percent / 100.0
             )
         
+        remote_dir = self.current_path
+        
         def on_complete(success, uploaded, failed, error):
             progress_dialog.close()
             
@@ -692,14 +1047,27 @@ class FileExplorerTab:
                     "Upload Complete",
                     f"Uploaded {uploaded} files successfully."
                 )
-                # Refresh view
-                self.refresh_view()
             else:
                 messagebox.showerror(
                     "Upload Failed",
                     f"Upload failed: {error}\n"
                     f"Files uploaded: {uploaded}, Files failed: {failed}"
                 )
+            
+            if uploaded == len(files):
+                # Show the uploaded files from their local attributes rather than re-listing
+                entries = []
+                for local_path in files:
+                    st = os.stat(local_path)
+                    entries.append(self._local_entry(remote_dir, os.path.basename(local_path),
+                                                     'file', st.st_size, stat.S_IFREG | 0o644))
+                self._add_entries(remote_dir, entries)
+            elif uploaded:
+                # Some were skipped or failed and the counts do not say which, list the
+                # directory again rather than show local attributes for the wrong files
+                self._invalidate_cache(remote_dir)
+                if remote_dir == self.current_path:
+                    self.refresh_view(force=True)
         
         # Start upload
         self.sftp_ops.upload_files(
@@ -729,20 +1097,23 @@ class FileExplorerTab:
         self.sftp_ops.create_directory(
             self.current_path,
             folder_name,
-            on_complete=lambda success, error: self._on_create_folder_complete(
-                success, error, folder_name
+            on_complete=lambda success, error, parent=self.current_path: self._on_create_folder_complete(
+                success, error, folder_name, parent
             )
         )
     
-    def _on_create_folder_complete(self, success, error, folder_name):
+    def _on_create_folder_complete(self, success, error, folder_name, parent_path=None):
         """Handle folder creation completion"""
         if success:
             messagebox.showinfo(
                 "Folder Created",
                 f"Folder '{folder_name}' created successfully."
             )
-            # Refresh view
-            self.refresh_view()
+            # Add the row locally instead of re-listing the directory
+            parent_path = parent_path or self.current_path
+            self._add_entries(parent_path, [
+                self._local_entry(parent_path, folder_name, 'directory', 0, stat.S_IFDIR | 0o755)
+            ])
         else:
             messagebox.showerror(
                 "Error",
@@ -773,22 +1144,33 @@ class FileExplorerTab:
         ):
             return
         
-        # Delete items one by one
-        for item in items_to_delete:
-            self.sftp_ops.delete_item(
-                item,
-                on_complete=lambda success, error, item=item: self._on_delete_complete(
-                    success, error, item
-                )
+        # Delete all items in one batch
+        self.sftp_ops.delete_items(
+            items_to_delete,
+            on_complete=lambda deleted, failed: self._on_batch_delete_complete(
+                deleted, failed, items_to_delete
             )
+        )
     
-    def _on_delete_complete(self, success, error, item):
-        """Handle item deletion completion"""
-        if not success:
+    def _on_batch_delete_complete(self, deleted, failed, items):
+        """Handle batch deletion completion"""
+        self._invalidate_cache(self.current_path, *(item['path'] for item in items))
+        
+        if failed:
             messagebox.showerror(
                 "Delete Failed",
-                f"Failed to delete {item['name']}: {error}"
+                f"Deleted {deleted} item(s), {len(failed)} failed:\n\n"
+                + "\n".join(f"{name}: {error}" for name, error in failed[:5])
+                + ("\n..." if len(failed) > 5 else "")
             )
+        else:
+            messagebox.showinfo(
+                "Delete Complete",
+                f"Deleted {deleted} item(s) successfully."
+            )
+        
+        # Refresh view
+        self.refresh_view()
     
     def _rename_selected(self):
         """Rename selected file or directory"""
@@ -819,11 +1201,11 @@ class FileExplorerTab:
             item,
             new_name,
             on_complete=lambda success, error: self._on_rename_complete(
-                success, error, item['name'], new_name
+                success, error, item['name'], new_name, item['path']
             )
         )
     
-    def _on_rename_complete(self, success, error, old_name, new_name):
+    def _on_rename_complete(self, success, error, old_name, new_name, old_path=None):
         """Handle item rename completion"""
         if success:
             messagebox.showinfo(
@@ -831,6 +1213,7 @@ class FileExplorerTab:
                 f"Renamed '{old_name}' to '{new_name}' successfully."
             )
             # Refresh view
+            self._invalidate_cache(self.current_path, old_path)
             self.refresh_view()
         else:
             messagebox.showerror(
@@ -892,6 +1275,10 @@ class FileExplorerTab:
     def _on_file_save_complete(self, success, error, path):
         """Handle file save completion"""
         if success:
+            # Size and modification time in the parent listing are now stale
+            self._invalidate_cache(posixpath.dirname(path))
+            self._preview_cache.pop(path, None)
+            
             messagebox.showinfo(
                 "Save Complete",
                 f"File saved successfully."
@@ -905,23 +1292,188 @@ class FileExplorerTab:
                 f"Failed to save file: {error}"
             )
     
+    def _get_cached_listing(self, path):
+        """Get the cached items for path, or None if it has not been listed recently"""
+        entry = self._dircache.get(path)
+        if entry and time.time() - entry[0] < self._dircache_ttl:
+            return entry[1]
+        return None
+    
+    def _cache_listing(self, path, items):
+        """Remember a listing, dropping the least recently listed path when full"""
+        self._dircache[path] = (time.time(), items)
+        self._dircache.move_to_end(path)
+        if len(self._dircache) > self._dircache_max:
+            self._dircache.popitem(last=False)
+    
+    def _revalidate_listing(self, path, force=False):
+        """Re-list a directory served from the cache, updating the tree only if it changed"""
+        entry = self._dircache.get(path)
+        if not entry or path in self._prefetch_inflight:
+            return
+        if not force and time.time() - entry[0] < self._dircache_recheck_age:
+            return
+        
+        self._prefetch_inflight.add(path)
+        self.sftp_ops.list_directory_background(
+            path,
+            on_complete=lambda success, items, error, p=path, old=entry[1], gen=self._listing_gen:
+                self._on_revalidated(p, old, success, items, gen)
+        )
+    
+    def _on_revalidated(self, path, old_items, success, items, gen):
+        """Cache a fresh listing and redraw the tree if it differs from the one shown"""
+        self._prefetch_inflight.discard(path)
+        if not success:
+            return
+        
+        self._cache_listing(path, items)
+        
+        # Leave the tree alone if the user moved on, is filtering or has a newer listing
+        if (gen != self._listing_gen or self._inflight_path is not None
+                or self.filter_var.get() or items == old_items):
+            return
+        
+        self._on_directory_listed(True, items, None, path)
+    
+    def _prefetch(self, path, items):
+        """Queue the parent and first few subdirectories of path for listing into the cache"""
+        self._prefetch_after_id = None
+        candidates = [posixpath.dirname(path)]
+        for item in items:
+            if len(candidates) > self._prefetch_max:
+                break
+            if item['type'] == 'directory' and not item.get('is_parent', False):
+                candidates.append(item['path'])
+        
+        # The newest listing decides what is worth prefetching, older candidates are dropped
+        self._prefetch_pending = [candidate for candidate in candidates if candidate != path]
+        self._prefetch_next()
+    
+    def _prefetch_next(self):
+        """Start pending prefetches while fewer than two are in flight"""
+        # At most two at a time, so they never crowd out user operations on the channel pool
+        while self._prefetch_running < 2 and self._prefetch_pending:
+            candidate = self._prefetch_pending.pop(0)
+            if candidate in self._prefetch_inflight or self._get_cached_listing(candidate) is not None:
+                continue
+            
+            self._prefetch_running += 1
+            self._prefetch_inflight.add(candidate)
+            self.sftp_ops.list_directory_background(
+                candidate,
+                on_complete=lambda success, listed, error, p=candidate: self._prefetch_store(p, success, listed)
+            )
+    
+    def _prefetch_selected(self, path):
+        """List the selected directory into the cache ahead of a double-click"""
+        self._select_prefetch_id = None
+        if path in self._prefetch_inflight or self._get_cached_listing(path) is not None:
+            return
+        
+        self._prefetch_inflight.add(path)
+        self.sftp_ops.list_directory_background(
+            path,
+            on_complete=lambda success, listed, error, p=path: self._prefetch_store(p, success, listed, release=False)
+        )
+    
+    def _prefetch_store(self, path, success, items, release=True):
+        """Cache a prefetched listing without touching the tree"""
+        self._prefetch_inflight.discard(path)
+        if success:
+            self._cache_listing(path, items)
+        if release:
+            self._prefetch_running -= 1
+            self._prefetch_next()
+    
+    def _local_entry(self, parent_path, name, item_type, size, mode):
+        """Build a listing entry for something this tab just created, mode is a best guess"""
+        return {
+            'name': name,
+            'path': parent_path.rstrip('/') + '/' + name,
+            'type': item_type,
+            'size': size,
+            'mtime': int(time.time()),
+            'mode': mode
+        }
+    
+    def _add_entries(self, path, entries):
+        """Merge newly created entries into the listing of path, then reconcile with the server shortly after"""
+        if path == self.current_path and self.unfiltered_items:
+            items = self.unfiltered_items
+        else:
+            items = self._get_cached_listing(path)
+        
+        if items is None:
+            # Nothing to merge into, fall back to listing the directory
+            self._invalidate_cache(path)
+            if path == self.current_path:
+                self.refresh_view()
+            return
+        
+        # Same order as a listing, '..' first then directories then files, each by name
+        names = {entry['name'] for entry in entries}
+        parent = [item for item in items if item.get('is_parent', False)]
+        rest = [item for item in items if not item.get('is_parent', False) and item['name'] not in names]
+        rest.extend(entries)
+        rest.sort(key=lambda item: (item['type'] != 'directory', item['name'].lower()))
+        merged = parent + rest
+        
+        self._invalidate_cache(*(entry['path'] for entry in entries))
+        self._cache_listing(path, merged)
+        if path == self.current_path:
+            self._on_directory_listed(True, merged, None, path)
+        
+        # Guessed modes and times are replaced by the server's once it has settled
+        self.frame.after(2000, lambda: self._revalidate_listing(path, force=True))
+    
+    def _invalidate_cache(self, *paths):
+        """Drop cached listings for the given directories and everything below them"""
+        for path in paths:
+            if not path:
+                continue
+            prefix = path.rstrip('/') + '/'
+            for cached in [p for p in self._dircache if p == path or p.startswith(prefix)]:
+                del self._dircache[cached]
+    
     def _format_size(self, size_bytes):
         """Format file size for display"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024 or unit == 'GB':
-                if unit == 'B':
-                    return f"{size_bytes} {unit}"
-                else:
-                    return f"{size_bytes/1024:.1f} {unit}"
-            size_bytes /= 1024
+        if size_bytes < 1024:
+            return f"{size_bytes} B"
+        
+        # Every 10 bits is one unit step, capped at TB
+        name, scale = _SIZE_UNITS[min((size_bytes.bit_length() - 1) // 10, 4)]
+        return f"{size_bytes / scale:.1f} {name}"
+    
+    def _format_mtime(self, mtime):
+        """Format a modification timestamp for display"""
+        if mtime is None:
+            return ""
+        try:
+            return time.strftime(_MTIME_FORMAT, time.localtime(mtime))
+        except (OverflowError, OSError, ValueError):
+            return "Unknown"
+    
+    def _format_mode(self, mode):
+        """Format a mode as a permissions string for display"""
+        return stat.filemode(mode) if mode is not None else ""
+    
+    def _sort_by(self, column):
+        """Sort the shown rows by a column on its raw value, toggling direction on repeat clicks"""
+        self._sort_reverse = column == self._sort_column and not self._sort_reverse
+        self._sort_column = column
+        
+        items = self._pending_items
+        parent = [item for item in items if item.get('is_parent', False)]
+        key = _SORT_KEYS[column]
+        rows = sorted((item for item in items if not item.get('is_parent', False)),
+                      key=key, reverse=self._sort_reverse)
+        # Keep directories grouped ahead of files whichever way the column sorts
+        rows.sort(key=lambda item: item['type'] != 'directory')
+        
+        self._populate_tree(parent + rows)
     
     def _is_text_file(self, filename):
         """Check if a file is likely a text file based on extension"""
-        text_extensions = [
-            '.txt', '.py', '.js', '.html', '.css', '.json', '.xml', '.md',
-            '.ini', '.conf', '.cfg', '.log', '.sh', '.bash', '.php', '.c',
-            '.cpp', '.h', '.java', '.yaml', '.yml', '.toml', '.csv', '.lua'
-        ]
-        
-        filename_lower = filename.lower()
-        return any(filename_lower.endswith(ext) for ext in text_extensions)
\ No newline at end of file
+        _, dot, ext = filename.rpartition('.')
+        return bool(dot) and ext.lower() in _TEXT_EXT
\ No newline at end of file
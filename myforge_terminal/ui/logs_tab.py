@@ -12,6 +12,7 @@ Structure:
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import os
+from collections import deque
 
 from utils.ui_utils import ContextMenu
 
@@ -25,6 +26,11 @@ class LogsTab:
         # Create frame for logs tab
         self.frame = tk.Frame(notebook, bg=theme_manager.bg_color)
         
+        # New entries from any thread, shown on the Tk thread by _flush_log_buffer. A flush is
+        # only scheduled when the buffer goes from empty to non-empty
+        self._log_buf = deque()
+        self._flush_scheduled = False
+        
         # Set up UI
         self._setup_ui()
         
@@ -128,39 +134,82 @@ class LogsTab:
     
     def _load_logs(self):
         """Load logs from logger"""
+        # Get all logs
+        logs = self._snapshot_logs()
+        
         self.logs_output.config(state=tk.NORMAL)
         self.logs_output.delete(1.0, tk.END)
         
-        # Get all logs
-        logs = self.logger.get_logs()
-        
-        # Insert logs
-        for log in logs:
-            self.logs_output.insert(tk.END, log + "\n")
+        # Insert logs, all in one Text.insert call
+        if logs:
+            self.logs_output.insert(tk.END, "\n".join(logs) + "\n")
         
         # Auto-scroll to end
         self.logs_output.see(tk.END)
         
         self.logs_output.config(state=tk.DISABLED)
     
+    def _snapshot_logs(self):
+        """Copy the logger's history and drop the queued entries it already contains"""
+        logs = list(self.logger.get_logs())
+        
+        # The logger records an entry before announcing it, so the queued entries already in
+        # the copy are the oldest ones queued and match its last entries. Later ones stay queued
+        queued = self._take_queued()
+        
+        overlap = min(len(queued), len(logs))
+        while overlap and logs[-overlap:] != queued[:overlap]:
+            overlap -= 1
+        
+        # Put the rest back in front of anything logged meanwhile
+        self._log_buf.extendleft(reversed(queued[overlap:]))
+        return logs
+    
+    def _take_queued(self):
+        """Remove and return every queued entry, oldest first"""
+        # The only place entries leave the buffer. It is only called on the Tk thread, so the
+        # emptiness check cannot race another taker, only appends from logging threads
+        entries = []
+        while self._log_buf:
+            entries.append(self._log_buf.popleft())
+        return entries
+    
     def _on_log_added(self, log_entry):
-        """Handle new log entry"""
+        """Handle new log entry, called on whichever thread logged it"""
+        self._log_buf.append(log_entry)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            try:
+                self.frame.after_idle(self._flush_log_buffer)
+            except (tk.TclError, RuntimeError):
+                # Window destroyed or main loop gone
+                pass
+    
+    def _flush_log_buffer(self):
+        """Show the entries logged since the last flush in one insert"""
+        # Cleared before draining, so an entry queued from here on schedules another flush
+        self._flush_scheduled = False
+        
         if not hasattr(self, 'logs_output') or not self.logs_output.winfo_exists():
             return
         
+        entries = self._take_queued()
+        
+        # Entries hidden by the filter are not shown, the rest of the display stays as it is
+        filter_text = self.filter_var.get().lower()
+        if filter_text:
+            entries = [entry for entry in entries if filter_text in entry.lower()]
+        
         try:
-            self.logs_output.config(state=tk.NORMAL)
-            self.logs_output.insert(tk.END, log_entry + "\n")
-            
-            # Apply filter
-            if self.filter_var.get():
-                self._apply_filter()
-            
-            # Auto-scroll if enabled
-            if self.auto_scroll_var.get():
-                self.logs_output.see(tk.END)
-            
-            self.logs_output.config(state=tk.DISABLED)
+            if entries:
+                self.logs_output.config(state=tk.NORMAL)
+                self.logs_output.insert(tk.END, "\n".join(entries) + "\n")
+                
+                # Auto-scroll if enabled
+                if self.auto_scroll_var.get():
+                    self.logs_output.see(tk.END)
+                
+                self.logs_output.config(state=tk.DISABLED)
         except tk.TclError:
             # Widget might be destroyed
             pass
@@ -173,8 +222,8 @@ class LogsTab:
             self._load_logs()
             return
         
-        # Get all logs
-        logs = self.logger.get_logs()
+        # Get all logs, queued entries included
+        logs = self._snapshot_logs()
         
         # Filter logs
         filtered_logs = [log for log in logs if filter_text in log.lower()]
@@ -183,8 +232,8 @@ class LogsTab:
         self.logs_output.config(state=tk.NORMAL)
         self.logs_output.delete(1.0, tk.END)
         
-        for log in filtered_logs:
-            self.logs_output.insert(tk.END, log + "\n")
+        if filtered_logs:
+            self.logs_output.insert(tk.END, "\n".join(filtered_logs) + "\n")
         
         # Auto-scroll to end
         self.logs_output.see(tk.END)
@@ -35,6 +35,7 @@ class MainWindow:
         # Initialize components
         self.ssh_client = SSHClient(config, logger)
         self.sftp_ops = SFTPOperations(self.ssh_client, logger)
+        self.sftp_ops.start_progress_pump(self.root)
         
         # Set up theme manager
         self.theme_manager = ThemeManager(self.root, config)
@@ -357,6 +358,7 @@ class MainWindow:
                         # messagebox.showwarning("Disconnect Issue", 
                         #                        f"Could not disconnect cleanly: {message}", 
                         #                        parent=self.root if self.root.winfo_exists() else None)
+                    self.sftp_ops.close()
                     if self.root.winfo_exists(): # Check if root window still exists
                         self.root.destroy()
 
@@ -366,6 +368,7 @@ class MainWindow:
             # else: User selected 'No', so don't close the window or disconnect
         else:
             # Not connected, so just destroy the window
+            self.sftp_ops.close()
             if self.root.winfo_exists(): 
                 self.root.destroy()
     
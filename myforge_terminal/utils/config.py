@@ -50,9 +50,12 @@ class Config:
     
     def save(self):
         """Save configuration to file"""
+        # Write to a temp file and swap it in, so an interrupted save keeps the old config
+        tmp_filename = f"{self.filename}.tmp"
         try:
-            with open(self.filename, "w") as f:
+            with open(tmp_filename, "w") as f:
                 json.dump(self.config, f, indent=2)
+            os.replace(tmp_filename, self.filename)
         except Exception as e:
             print(f"Error saving configuration: {e}")
     